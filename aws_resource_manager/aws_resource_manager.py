@@ -11,33 +11,28 @@ through an interactive command-line interface.
 import os
 import sys
 import logging
-import importlib.util
-from typing import List, Dict, Any, Optional
+import functools
+import contextlib
+from typing import List, Dict, Any, Callable, Iterator, Optional, TYPE_CHECKING
 
-# Add the current directory to the path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to the path so we can import our modules. When
+# run as a script it is usually there already, and a duplicate entry would
+# make every failed import probe the same directory twice.
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
 try:
     import typer
+except ImportError as e:
+    sys.stderr.write(f"Missing dependency ({e.name}). Run: pip install -r requirements.txt\n")
+    sys.exit(2)
+
+if TYPE_CHECKING:
     from rich.console import Console
-    from rich.logging import RichHandler
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.panel import Panel
-    from rich import print as rprint
-except ImportError:
-    print("Required dependencies not found. Installing dependencies...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-    print("Dependencies installed. Restarting script...")
-    os.execv(sys.executable, ['python'] + sys.argv)
-
-# Import core modules
-from core.engine import ResourceEngine
-from core.plugin_manager import PluginManager
-from core.config_manager import ConfigManager
-from core.dependency_resolver import DependencyResolver
-from utils.validators import validate_aws_credentials
-from utils.logger import setup_logger
+    from rich.progress import Progress
+    from core.engine import ResourceEngine
+    from core.plugin_manager import PluginManager
 
 # Initialize Typer app
 app = typer.Typer(
@@ -45,34 +40,220 @@ app = typer.Typer(
     add_completion=True
 )
 
-# Initialize Rich console
-console = Console()
+# Named console styles, used as console.print(..., style="err") so that
+# constant status messages don't need markup parsing
+CONSOLE_STYLES = {
+    "err": "bold red",
+    "ok": "bold green",
+    "warn": "yellow",
+    "info": "bold blue"
+}
+
+# Rich console and logger are created on first use so that trivial
+# invocations (--help, completion) don't pay for importing them
+_console: Optional["Console"] = None
+_logger: Optional[logging.Logger] = None
+_progress: Optional["Progress"] = None
+
+def get_console() -> "Console":
+    """
+    Get the shared Rich console, creating it on first use.
+    
+    Returns:
+        Console: The shared console
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        from rich.theme import Theme
+        _console = Console(theme=Theme(CONSOLE_STYLES))
+    return _console
+
+def get_logger() -> logging.Logger:
+    """
+    Get the module logger, creating it on first use.
+    
+    Returns:
+        logging.Logger: The module logger
+    """
+    global _logger
+    if _logger is None:
+        from utils.logger import setup_logger
+        _logger = setup_logger(__name__)
+    return _logger
+
+class _LazyRichHandler(logging.Handler):
+    """
+    Logging handler that creates the real RichHandler on the first record
+    """
+    
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level)
+        self._handler: Optional[logging.Handler] = None
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._handler is None:
+            from rich.logging import RichHandler
+            self._handler = RichHandler()
+            self._handler.setFormatter(self.formatter)
+        self._handler.emit(record)
 
-# Initialize logger
-logger = setup_logger(__name__)
+@contextlib.contextmanager
+def spinner(description: str) -> Iterator[None]:
+    """
+    Show a transient spinner while the wrapped block runs.
+    
+    A single Progress instance is created on first use and reused by
+    every command.
+    
+    Args:
+        description: Text to show next to the spinner
+    """
+    global _progress
+    if _progress is None:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        _progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[bold blue]{task.description}"),
+            console=get_console(),
+            transient=True
+        )
+    
+    task = _progress.add_task(description, total=None)
+    _progress.start()
+    try:
+        yield
+    finally:
+        _progress.stop()
+        _progress.remove_task(task)
+
+def _renders_errors(message: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorate a command so unexpected errors are logged and rendered once.
+    
+    Args:
+        message: Prefix for the rendered error (e.g., "Error creating resource")
+        
+    Returns:
+        Decorator that wraps the command
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except (typer.BadParameter, typer.Exit, typer.Abort):
+                # Usage errors and explicit exits are rendered by Typer
+                raise
+            except Exception as e:
+                get_logger().exception(message)
+                get_console().print(f"{message}: {str(e)}", style="err")
+        return wrapper
+    return decorator
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve the lazily created module attributes (PEP 562).
+    """
+    if name == "console":
+        return get_console()
+    if name == "logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@functools.lru_cache(maxsize=1)
+def _installed_distributions() -> frozenset:
+    """
+    Get the normalized names of all installed distributions.
+    
+    Returns:
+        frozenset: Lowercase distribution names with '-' replaced by '_'
+    """
+    import importlib.metadata
+    
+    names = (dist.metadata["Name"] for dist in importlib.metadata.distributions())
+    return frozenset(name.lower().replace("-", "_") for name in names if name)
+
+def _dependency_marker_path() -> str:
+    """
+    Get the marker file recording a successful dependency check.
+    
+    The marker name is keyed on the interpreter so that each Python
+    installation or virtualenv keeps its own marker.
+    
+    Returns:
+        str: Path to the marker file
+    """
+    import hashlib
+    
+    key = hashlib.blake2b((sys.executable + sys.version).encode(), digest_size=16).hexdigest()
+    return os.path.join(os.path.expanduser("~"), ".cache", "aws_resource_manager", f"deps.{key}")
+
+def _dependency_marker_is_fresh(marker_path: str) -> bool:
+    """
+    Check if the dependency marker is newer than the interpreter and its
+    site-packages directories (which change when packages are installed or
+    removed).
+    
+    Args:
+        marker_path: Path to the marker file
+        
+    Returns:
+        bool: True if the marker can be trusted, False otherwise
+    """
+    import sysconfig
+    
+    try:
+        marker_mtime = os.stat(marker_path).st_mtime
+    except OSError:
+        return False
+    
+    paths = sysconfig.get_paths()
+    for path in {sys.executable, paths["purelib"], paths["platlib"]}:
+        try:
+            if os.stat(path).st_mtime > marker_mtime:
+                return False
+        except OSError:
+            continue
+    
+    return True
 
 def check_dependencies() -> bool:
     """
     Check if all required dependencies are installed.
     
+    A successful check leaves a marker file, letting later runs on an
+    unchanged interpreter skip the scan.
+    
     Returns:
         bool: True if all dependencies are installed, False otherwise
     """
+    marker_path = _dependency_marker_path()
+    if _dependency_marker_is_fresh(marker_path):
+        return True
+    
     required_packages = [
         "boto3", "typer", "rich", "pyyaml", "pydantic", 
-        "networkx", "prompt_toolkit", "cryptography"
+        "prompt_toolkit", "cryptography"
     ]
     
-    missing_packages = []
-    
-    for package in required_packages:
-        if importlib.util.find_spec(package) is None:
-            missing_packages.append(package)
+    installed = _installed_distributions()
+    missing_packages = [
+        package for package in required_packages
+        if package.lower().replace("-", "_") not in installed
+    ]
     
     if missing_packages:
-        console.print(f"[bold red]Missing dependencies: {', '.join(missing_packages)}[/bold red]")
+        get_console().print(f"Missing dependencies: {', '.join(missing_packages)}", style="err")
         return False
     
+    try:
+        os.makedirs(os.path.dirname(marker_path), exist_ok=True)
+        with open(marker_path, "w"):
+            pass
+    except OSError:
+        get_logger().debug("Could not write dependency marker %s", marker_path)
+    
     return True
 
 def check_aws_cli_config() -> bool:
@@ -82,12 +263,17 @@ def check_aws_cli_config() -> bool:
     Returns:
         bool: True if AWS CLI is configured, False otherwise
     """
+    from utils.validators import validate_aws_credentials
+    
     return validate_aws_credentials()
 
 def display_welcome_banner() -> None:
     """
     Display a welcome banner when the application starts.
     """
+    from rich.panel import Panel
+    console = get_console()
+    
     welcome_text = """
     AWS Resource Manager
 
@@ -99,13 +285,17 @@ def display_welcome_banner() -> None:
     
     console.print(Panel(welcome_text, title="Welcome", border_style="blue"))
 
-def initialize_app() -> ResourceEngine:
+@functools.lru_cache(maxsize=1)
+def _shared_plugin_manager() -> "PluginManager":
     """
-    Initialize the application and its components.
+    Get the process-wide plugin manager, discovering plugins on first use.
     
     Returns:
-        ResourceEngine: The initialized resource engine
+        PluginManager: The plugin manager with all plugins loaded
     """
+    from core.plugin_manager import PluginManager
+    from core.config_manager import ConfigManager
+    
     # Initialize configuration manager
     config_manager = ConfigManager()
     
@@ -113,18 +303,42 @@ def initialize_app() -> ResourceEngine:
     plugin_manager = PluginManager(config_manager)
     plugin_manager.discover_plugins()
     
+    return plugin_manager
+
+def initialize_app() -> "ResourceEngine":
+    """
+    Initialize the application and its components.
+    
+    Returns:
+        ResourceEngine: The initialized resource engine
+    """
+    from core.engine import ResourceEngine
+    from core.dependency_resolver import DependencyResolver
+    
+    plugin_manager = _shared_plugin_manager()
+    
     # Initialize dependency resolver
     dependency_resolver = DependencyResolver()
     
     # Initialize resource engine
     engine = ResourceEngine(
-        config_manager=config_manager,
+        config_manager=plugin_manager.config_manager,
         plugin_manager=plugin_manager,
         dependency_resolver=dependency_resolver
     )
     
     return engine
 
+def _close_engine(engine_factory: Callable[[], "ResourceEngine"]) -> None:
+    """
+    Shut down the engine if this invocation created one.
+    
+    Args:
+        engine_factory: The cached engine factory stored in the context
+    """
+    if engine_factory.cache_info().currsize:
+        engine_factory().close()
+
 @app.callback()
 def main(
     ctx: typer.Context,
@@ -136,25 +350,36 @@ def main(
     """
     AWS Resource Manager - A tool for managing AWS resources
     """
+    # Nothing to set up while Typer is only resolving shell completions
+    if ctx.resilient_parsing:
+        return
+    
     # Set log level
     numeric_level = getattr(logging, log_level.upper(), None)
     if not isinstance(numeric_level, int):
         raise ValueError(f"Invalid log level: {log_level}")
-    logging.basicConfig(level=numeric_level, handlers=[RichHandler()])
     
-    # Store context in state
+    # Display welcome banner if no command is specified; it only needs Rich
+    if ctx.invoked_subcommand is None:
+        display_welcome_banner()
+        return
+    
+    logging.basicConfig(level=numeric_level, handlers=[_LazyRichHandler()])
+    
+    # Store context in state; the engine is built on first use and then
+    # reused for the rest of the invocation
+    engine_factory = functools.lru_cache(maxsize=1)(initialize_app)
     ctx.obj = {
         "log_level": log_level,
         "config_file": config_file,
         "profile": profile,
-        "region": region
+        "region": region,
+        "engine_factory": engine_factory
     }
-    
-    # Display welcome banner if no command is specified
-    if ctx.invoked_subcommand is None:
-        display_welcome_banner()
+    ctx.call_on_close(functools.partial(_close_engine, engine_factory))
 
 @app.command()
+@_renders_errors("Error creating resource")
 def create(
     ctx: typer.Context,
     service: str = typer.Argument(..., help="AWS service (e.g., ec2, s3, rds)"),
@@ -168,78 +393,60 @@ def create(
     """
     Create AWS resources
     """
-    engine = initialize_app()
+    console = get_console()
+    
+    engine = ctx.obj["engine_factory"]()
     
-    with Progress(
-        SpinnerColumn(), 
-        TextColumn("[bold blue]{task.description}"),
-        transient=True
-    ) as progress:
-        task = progress.add_task(f"Creating {service} resource...", total=None)
+    with spinner(f"Creating {service} resource..."):
+        result = engine.create_resource(
+            service=service,
+            resource_name=resource_name,
+            template_name=template,
+            guided=guided,
+            dry_run=dry_run,
+            skip_dependency_check=skip_dependency_check
+        )
         
-        try:
-            result = engine.create_resource(
-                service=service,
-                resource_name=resource_name,
-                template_name=template,
-                guided=guided,
-                dry_run=dry_run,
-                skip_dependency_check=skip_dependency_check
-            )
-            
-            progress.update(task, completed=True)
-            
-            if result.success:
-                console.print(f"[bold green]Successfully created {service} resource:[/bold green]")
-                console.print(result.output)
-            else:
-                console.print(f"[bold red]Failed to create {service} resource:[/bold red]")
-                console.print(f"[red]{result.error_message}[/red]")
-                
-        except Exception as e:
-            logger.exception("Error creating resource")
-            console.print(f"[bold red]Error creating resource: {str(e)}[/bold red]")
+        if result.success:
+            console.print(f"Successfully created {service} resource:", style="ok")
+            console.print(result.output)
+        else:
+            console.print(f"Failed to create {service} resource:", style="err")
+            console.print(result.error_message, style="red")
 
 @app.command()
+@_renders_errors("Error listing resources")
 def list(
     ctx: typer.Context,
     service: str = typer.Argument(..., help="AWS service (e.g., ec2, s3, rds)"),
     output_format: str = typer.Option("rich", help="Output format (rich, json, yaml)"),
-    filter: str = typer.Option(None, help="Filter resources (e.g., Name=value)")
+    filter: str = typer.Option(None, help="Filter resources (e.g., Name=value)"),
+    page_size: int = typer.Option(1000, help="Number of items to request per AWS API page")
 ) -> None:
     """
     List AWS resources
     """
-    engine = initialize_app()
+    console = get_console()
+    
+    engine = ctx.obj["engine_factory"]()
     
-    with Progress(
-        SpinnerColumn(), 
-        TextColumn("[bold blue]{task.description}"),
-        transient=True
-    ) as progress:
-        task = progress.add_task(f"Listing {service} resources...", total=None)
+    with spinner(f"Listing {service} resources..."):
+        result = engine.list_resources(
+            service=service,
+            output_format=output_format,
+            filter_expr=filter,
+            page_size=page_size
+        )
         
-        try:
-            result = engine.list_resources(
-                service=service,
-                output_format=output_format,
-                filter_expr=filter
-            )
-            
-            progress.update(task, completed=True)
-            
-            if result.success:
-                console.print(f"[bold green]{service.upper()} Resources:[/bold green]")
-                console.print(result.output)
-            else:
-                console.print(f"[bold red]Failed to list {service} resources:[/bold red]")
-                console.print(f"[red]{result.error_message}[/red]")
-                
-        except Exception as e:
-            logger.exception("Error listing resources")
-            console.print(f"[bold red]Error listing resources: {str(e)}[/bold red]")
+        if result.success:
+            console.print(f"{service.upper()} Resources:", style="ok")
+            console.print(result.output)
+        else:
+            console.print(f"Failed to list {service} resources:", style="err")
+            console.print(result.error_message, style="red")
 
 @app.command()
+@_renders_errors("Error deleting resource")
 def delete(
     ctx: typer.Context,
     service: str = typer.Argument(..., help="AWS service (e.g., ec2, s3, rds)"),
@@ -251,43 +458,33 @@ def delete(
     """
     Delete AWS resources
     """
-    engine = initialize_app()
+    console = get_console()
+    
+    engine = ctx.obj["engine_factory"]()
     
     if not force:
         confirmed = typer.confirm(f"Are you sure you want to delete the {service} resource with ID {resource_id}?")
         if not confirmed:
-            console.print("[yellow]Operation cancelled by user[/yellow]")
+            console.print("Operation cancelled by user", style="warn")
             return
     
-    with Progress(
-        SpinnerColumn(), 
-        TextColumn("[bold blue]{task.description}"),
-        transient=True
-    ) as progress:
-        task = progress.add_task(f"Deleting {service} resource...", total=None)
+    with spinner(f"Deleting {service} resource..."):
+        result = engine.delete_resource(
+            service=service,
+            resource_id=resource_id,
+            dry_run=dry_run,
+            skip_dependency_check=skip_dependency_check
+        )
         
-        try:
-            result = engine.delete_resource(
-                service=service,
-                resource_id=resource_id,
-                dry_run=dry_run,
-                skip_dependency_check=skip_dependency_check
-            )
-            
-            progress.update(task, completed=True)
-            
-            if result.success:
-                console.print(f"[bold green]Successfully deleted {service} resource:[/bold green]")
-                console.print(result.output)
-            else:
-                console.print(f"[bold red]Failed to delete {service} resource:[/bold red]")
-                console.print(f"[red]{result.error_message}[/red]")
-                
-        except Exception as e:
-            logger.exception("Error deleting resource")
-            console.print(f"[bold red]Error deleting resource: {str(e)}[/bold red]")
+        if result.success:
+            console.print(f"Successfully deleted {service} resource:", style="ok")
+            console.print(result.output)
+        else:
+            console.print(f"Failed to delete {service} resource:", style="err")
+            console.print(result.error_message, style="red")
 
 @app.command()
+@_renders_errors("Error updating resource")
 def update(
     ctx: typer.Context,
     service: str = typer.Argument(..., help="AWS service (e.g., ec2, s3, rds)"),
@@ -299,44 +496,38 @@ def update(
     """
     Update AWS resources
     """
-    engine = initialize_app()
+    console = get_console()
+    
+    engine = ctx.obj["engine_factory"]()
     
     # Parse parameters
-    param_dict = {}
-    for param in parameters:
-        key, value = param.split('=', 1)
-        param_dict[key] = value
-    
-    with Progress(
-        SpinnerColumn(), 
-        TextColumn("[bold blue]{task.description}"),
-        transient=True
-    ) as progress:
-        task = progress.add_task(f"Updating {service} resource...", total=None)
+    split_params = [param.partition('=') for param in parameters]
+    invalid_params = [key for key, sep, _ in split_params if not sep]
+    if invalid_params:
+        raise typer.BadParameter(
+            f"Expected key=value, got: {', '.join(invalid_params)}",
+            param_hint="--parameters"
+        )
+    param_dict = {key: value for key, _, value in split_params}
+    
+    with spinner(f"Updating {service} resource..."):
+        result = engine.update_resource(
+            service=service,
+            resource_id=resource_id,
+            parameters=param_dict,
+            guided=guided,
+            dry_run=dry_run
+        )
         
-        try:
-            result = engine.update_resource(
-                service=service,
-                resource_id=resource_id,
-                parameters=param_dict,
-                guided=guided,
-                dry_run=dry_run
-            )
-            
-            progress.update(task, completed=True)
-            
-            if result.success:
-                console.print(f"[bold green]Successfully updated {service} resource:[/bold green]")
-                console.print(result.output)
-            else:
-                console.print(f"[bold red]Failed to update {service} resource:[/bold red]")
-                console.print(f"[red]{result.error_message}[/red]")
-                
-        except Exception as e:
-            logger.exception("Error updating resource")
-            console.print(f"[bold red]Error updating resource: {str(e)}[/bold red]")
+        if result.success:
+            console.print(f"Successfully updated {service} resource:", style="ok")
+            console.print(result.output)
+        else:
+            console.print(f"Failed to update {service} resource:", style="err")
+            console.print(result.error_message, style="red")
 
 @app.command()
+@_renders_errors("Error in batch creation")
 def batch_create(
     ctx: typer.Context,
     file: str = typer.Argument(..., help="YAML file containing resource definitions"),
@@ -346,36 +537,26 @@ def batch_create(
     """
     Create multiple AWS resources from a YAML file
     """
-    engine = initialize_app()
+    console = get_console()
+    
+    engine = ctx.obj["engine_factory"]()
     
-    with Progress(
-        SpinnerColumn(), 
-        TextColumn("[bold blue]{task.description}"),
-        transient=True
-    ) as progress:
-        task = progress.add_task(f"Creating resources from {file}...", total=None)
+    with spinner(f"Creating resources from {file}..."):
+        result = engine.batch_create_resources(
+            file_path=file,
+            dry_run=dry_run,
+            ignore_errors=ignore_errors
+        )
         
-        try:
-            result = engine.batch_create_resources(
-                file_path=file,
-                dry_run=dry_run,
-                ignore_errors=ignore_errors
-            )
-            
-            progress.update(task, completed=True)
-            
-            if result.success:
-                console.print(f"[bold green]Successfully created resources:[/bold green]")
-                console.print(result.output)
-            else:
-                console.print(f"[bold red]Failed to create resources:[/bold red]")
-                console.print(f"[red]{result.error_message}[/red]")
-                
-        except Exception as e:
-            logger.exception("Error in batch creation")
-            console.print(f"[bold red]Error in batch creation: {str(e)}[/bold red]")
+        if result.success:
+            console.print(f"Successfully created resources:", style="ok")
+            console.print(result.output)
+        else:
+            console.print(f"Failed to create resources:", style="err")
+            console.print(result.error_message, style="red")
 
 @app.command()
+@_renders_errors("Error exporting resources")
 def export(
     ctx: typer.Context,
     format: str = typer.Option("terraform", help="Export format (terraform, cloudformation, cdk)"),
@@ -386,90 +567,91 @@ def export(
     """
     Export AWS resources as Infrastructure as Code
     """
-    engine = initialize_app()
+    console = get_console()
     
-    with Progress(
-        SpinnerColumn(), 
-        TextColumn("[bold blue]{task.description}"),
-        transient=True
-    ) as progress:
-        task = progress.add_task(f"Exporting resources as {format}...", total=None)
+    engine = ctx.obj["engine_factory"]()
+    
+    with spinner(f"Exporting resources as {format}..."):
+        result = engine.export_resources(
+            export_format=format,
+            output_path=output,
+            resource_ids=resources,
+            region=region or ctx.obj.get("region")
+        )
         
-        try:
-            result = engine.export_resources(
-                export_format=format,
-                output_path=output,
-                resource_ids=resources,
-                region=region or ctx.obj.get("region")
-            )
-            
-            progress.update(task, completed=True)
-            
-            if result.success:
-                console.print(f"[bold green]Successfully exported resources:[/bold green]")
-                console.print(f"Output: {result.output}")
-            else:
-                console.print(f"[bold red]Failed to export resources:[/bold red]")
-                console.print(f"[red]{result.error_message}[/red]")
-                
-        except Exception as e:
-            logger.exception("Error exporting resources")
-            console.print(f"[bold red]Error exporting resources: {str(e)}[/bold red]")
+        if result.success:
+            console.print(f"Successfully exported resources:", style="ok")
+            console.print(f"Output: {result.output}")
+        else:
+            console.print(f"Failed to export resources:", style="err")
+            console.print(result.error_message, style="red")
 
 @app.command()
 def doctor(ctx: typer.Context) -> None:
     """
     Run diagnostics to check for common issues
     """
-    console.print("[bold blue]Running diagnostics...[/bold blue]")
+    from concurrent.futures import ThreadPoolExecutor
+    console = get_console()
     
-    # Check dependencies
-    console.print("Checking Python dependencies...")
-    if check_dependencies():
-        console.print("[green]✓ All required Python packages are installed[/green]")
-    else:
-        console.print("[red]✗ Some required Python packages are missing[/red]")
+    console.print("Running diagnostics...", style="info")
     
-    # Check AWS CLI configuration
-    console.print("Checking AWS CLI configuration...")
-    if check_aws_cli_config():
-        console.print("[green]✓ AWS CLI is properly configured[/green]")
-    else:
-        console.print("[red]✗ AWS CLI configuration issue detected[/red]")
-        console.print("""
-        Try running: aws configure
-        Or set environment variables:
-        - AWS_ACCESS_KEY_ID
-        - AWS_SECRET_ACCESS_KEY
-        - AWS_REGION
-        """)
-    
-    # Check for plugin issues
-    engine = initialize_app()
-    console.print("Checking plugins...")
-    plugin_issues = engine.plugin_manager.check_plugins()
-    
-    if not plugin_issues:
-        console.print("[green]✓ All plugins are working correctly[/green]")
-    else:
-        console.print("[red]✗ Some plugin issues detected:[/red]")
-        for issue in plugin_issues:
-            console.print(f"  - {issue}")
-    
-    # Check AWS permissions
-    console.print("Checking AWS permissions...")
-    try:
-        permission_issues = engine.check_permissions()
-        if not permission_issues:
-            console.print("[green]✓ AWS permissions check passed[/green]")
+    # The checks are independent and mostly wait on AWS or the filesystem,
+    # so run them concurrently and report the results in a fixed order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        dependencies_future = executor.submit(check_dependencies)
+        aws_config_future = executor.submit(check_aws_cli_config)
+        
+        engine = ctx.obj["engine_factory"]()
+        plugins_future = executor.submit(engine.plugin_manager.check_plugins)
+        permissions_future = executor.submit(engine.check_permissions)
+        
+        # Check dependencies
+        console.print("Checking Python dependencies...")
+        if dependencies_future.result():
+            console.print("✓ All required Python packages are installed", style="green")
         else:
-            console.print("[red]✗ AWS permission issues detected:[/red]")
-            for issue in permission_issues:
+            console.print("✗ Some required Python packages are missing", style="red")
+        
+        # Check AWS CLI configuration
+        console.print("Checking AWS CLI configuration...")
+        if aws_config_future.result():
+            console.print("✓ AWS CLI is properly configured", style="green")
+        else:
+            console.print("✗ AWS CLI configuration issue detected", style="red")
+            console.print("""
+            Try running: aws configure
+            Or set environment variables:
+            - AWS_ACCESS_KEY_ID
+            - AWS_SECRET_ACCESS_KEY
+            - AWS_REGION
+            """)
+        
+        # Check for plugin issues
+        console.print("Checking plugins...")
+        plugin_issues = plugins_future.result()
+        
+        if not plugin_issues:
+            console.print("✓ All plugins are working correctly", style="green")
+        else:
+            console.print("✗ Some plugin issues detected:", style="red")
+            for issue in plugin_issues:
                 console.print(f"  - {issue}")
-    except Exception as e:
-        console.print(f"[red]✗ Error checking AWS permissions: {str(e)}[/red]")
+        
+        # Check AWS permissions
+        console.print("Checking AWS permissions...")
+        try:
+            permission_issues = permissions_future.result()
+            if not permission_issues:
+                console.print("✓ AWS permissions check passed", style="green")
+            else:
+                console.print("✗ AWS permission issues detected:", style="red")
+                for issue in permission_issues:
+                    console.print(f"  - {issue}")
+        except Exception as e:
+            console.print(f"✗ Error checking AWS permissions: {str(e)}", style="red")
     
-    console.print("[bold blue]Diagnostics complete[/bold blue]")
+    console.print("Diagnostics complete", style="info")
 
 @app.command()
 def shell(ctx: typer.Context) -> None:
@@ -478,45 +660,36 @@ def shell(ctx: typer.Context) -> None:
     """
     from core.interactive_shell import InteractiveShell
     
-    engine = initialize_app()
+    engine = ctx.obj["engine_factory"]()
     shell = InteractiveShell(engine)
     
     display_welcome_banner()
     shell.start()
 
 @app.command()
+@_renders_errors("Error listing templates")
 def list_templates(ctx: typer.Context, service: Optional[str] = typer.Option(None, help="Filter templates by service")) -> None:
     """
     List available templates for resource creation
     """
-    engine = initialize_app()
+    console = get_console()
+    
+    engine = ctx.obj["engine_factory"]()
     
-    with Progress(
-        SpinnerColumn(), 
-        TextColumn("[bold blue]{task.description}"),
-        transient=True
-    ) as progress:
-        task = progress.add_task("Loading templates...", total=None)
+    with spinner("Loading templates..."):
+        templates = engine.get_templates(service)
         
-        try:
-            templates = engine.get_templates(service)
-            
-            progress.update(task, completed=True)
-            
-            if templates:
-                console.print("[bold green]Available Templates:[/bold green]")
-                for category, template_list in templates.items():
-                    console.print(f"\n[bold cyan]{category.upper()}[/bold cyan]")
-                    for template in template_list:
-                        console.print(f"  [yellow]{template['name']}[/yellow]: {template['description']}")
-            else:
-                console.print("[yellow]No templates found[/yellow]")
-                
-        except Exception as e:
-            logger.exception("Error listing templates")
-            console.print(f"[bold red]Error listing templates: {str(e)}[/bold red]")
+        if templates:
+            console.print("Available Templates:", style="ok")
+            for category, template_list in templates.items():
+                console.print(f"\n{category.upper()}", style="bold cyan")
+                for template in template_list:
+                    console.print(f"  [yellow]{template['name']}[/yellow]: {template['description']}")
+        else:
+            console.print("No templates found", style="warn")
 
 @app.command()
+@_renders_errors("Error creating template")
 def create_template(
     ctx: typer.Context,
     name: str = typer.Argument(..., help="Name of the template"),
@@ -527,37 +700,27 @@ def create_template(
     """
     Create a new template from existing resources
     """
-    engine = initialize_app()
+    console = get_console()
+    
+    engine = ctx.obj["engine_factory"]()
     
-    with Progress(
-        SpinnerColumn(), 
-        TextColumn("[bold blue]{task.description}"),
-        transient=True
-    ) as progress:
-        task = progress.add_task("Creating template...", total=None)
+    with spinner("Creating template..."):
+        result = engine.create_template(
+            name=name,
+            description=description,
+            resource_ids=from_resources,
+            output_path=output
+        )
         
-        try:
-            result = engine.create_template(
-                name=name,
-                description=description,
-                resource_ids=from_resources,
-                output_path=output
-            )
-            
-            progress.update(task, completed=True)
-            
-            if result.success:
-                console.print(f"[bold green]Successfully created template '{name}':[/bold green]")
-                console.print(f"Template saved to: {result.output}")
-            else:
-                console.print(f"[bold red]Failed to create template:[/bold red]")
-                console.print(f"[red]{result.error_message}[/red]")
-                
-        except Exception as e:
-            logger.exception("Error creating template")
-            console.print(f"[bold red]Error creating template: {str(e)}[/bold red]")
+        if result.success:
+            console.print(f"Successfully created template '{name}':", style="ok")
+            console.print(f"Template saved to: {result.output}")
+        else:
+            console.print(f"Failed to create template:", style="err")
+            console.print(result.error_message, style="red")
 
 @app.command()
+@_renders_errors("Error checking compliance")
 def check_compliance(
     ctx: typer.Context,
     service: str = typer.Argument(..., help="AWS service to check compliance for (e.g., iam, s3, ec2)"),
@@ -571,89 +734,85 @@ def check_compliance(
     """
     Check AWS resources for compliance with security standards
     """
-    engine = initialize_app()
+    console = get_console()
+    
+    engine = ctx.obj["engine_factory"]()
     
-    with Progress(
-        SpinnerColumn(), 
-        TextColumn("[bold blue]{task.description}"),
-        transient=True
-    ) as progress:
-        task = progress.add_task(f"Checking {service} compliance against {standard}...", total=None)
+    with spinner(f"Checking {service} compliance against {standard}..."):
+        # Prepare parameters
+        params = {
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "standard": standard,
+            "severity_threshold": severity_threshold
+        }
         
-        try:
-            # Prepare parameters
-            params = {
-                "resource_type": resource_type,
-                "resource_id": resource_id,
-                "standard": standard,
-                "severity_threshold": severity_threshold
-            }
-            
-            # Execute the check_compliance operation for the service
-            result = engine.execute_operation(
-                service=service,
-                operation="check_compliance",
-                **params
-            )
-            
-            progress.update(task, completed=True)
+        # Execute the check_compliance operation for the service
+        result = engine.execute_operation(
+            service=service,
+            operation="check_compliance",
+            **params
+        )
+        
+        if result.success:
+            # Display results
+            if output_format == "rich":
+                _display_compliance_results(result.output, service, standard)
+            elif output_format == "json":
+                sys.stdout.write(_dumps_json(result.output) + "\n")
+            elif output_format == "yaml":
+                import yaml
+                dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+                console.print(yaml.dump(result.output, Dumper=dumper))
+            elif output_format == "csv":
+                _export_compliance_csv(result.output, service, standard, report_file)
             
-            if result.success:
-                # Display results
-                if output_format == "rich":
-                    _display_compliance_results(result.output, service, standard)
-                elif output_format == "json":
-                    import json
-                    console.print(json.dumps(result.output, indent=2))
-                elif output_format == "yaml":
-                    import yaml
-                    console.print(yaml.dump(result.output))
-                elif output_format == "csv":
-                    _export_compliance_csv(result.output, service, standard, report_file)
-                
-                # Save report if requested
-                if report_file and output_format != "csv":
-                    _save_compliance_report(result.output, report_file, output_format)
-                    console.print(f"[green]Compliance report saved to {report_file}[/green]")
-            else:
-                console.print(f"[bold red]Failed to check {service} compliance:[/bold red]")
-                console.print(f"[red]{result.error_message}[/red]")
-                
-        except Exception as e:
-            logger.exception("Error checking compliance")
-            console.print(f"[bold red]Error checking compliance: {str(e)}[/bold red]")
+            # Save report if requested
+            if report_file and output_format != "csv":
+                _save_compliance_report(result.output, report_file, output_format)
+                console.print(f"Compliance report saved to {report_file}", style="green")
+        else:
+            console.print(f"Failed to check {service} compliance:", style="err")
+            console.print(result.error_message, style="red")
 
 def _display_compliance_results(results: Dict[str, Any], service: str, standard: str) -> None:
     """
     Display compliance results in a rich format
     """
     from rich.table import Table
+    from rich.text import Text
+    console = get_console()
     
-    console.print(f"[bold blue]Compliance Report: {service.upper()} against {standard.upper()}[/bold blue]")
+    # Build the status cells once instead of parsing markup on every row
+    compliant = Text("Compliant", style="green")
+    non_compliant = Text("Non-compliant", style="red")
+    admin_yes = Text("Yes", style="red")
+    
+    console.print(f"Compliance Report: {service.upper()} against {standard.upper()}", style="info")
     
     # Handle different result formats based on service
     if service == "iam":
         # Display password policy compliance
         if "password_policy" in results:
             pwd_policy = results["password_policy"]
-            console.print("\n[bold]Password Policy:[/bold]")
+            console.print("\nPassword Policy:", style="bold")
             
             table = Table(show_header=True, header_style="bold")
             table.add_column("Status")
             table.add_column("Issue")
             
             if pwd_policy["compliant"]:
-                table.add_row("[green]Compliant[/green]", "No issues found")
+                table.add_row(compliant, "No issues found")
             else:
                 for issue in pwd_policy["issues"]:
-                    table.add_row("[red]Non-compliant[/red]", issue)
+                    table.add_row(non_compliant, issue)
                     
             console.print(table)
         
         # Display MFA status
         if "mfa_status" in results:
             mfa_status = results["mfa_status"]
-            console.print("\n[bold]MFA Status:[/bold]")
+            console.print("\nMFA Status:", style="bold")
             
             table = Table(show_header=True, header_style="bold")
             table.add_column("Status")
@@ -661,29 +820,32 @@ def _display_compliance_results(results: Dict[str, Any], service: str, standard:
             table.add_column("Admin")
             
             if mfa_status["compliant"]:
-                table.add_row("[green]Compliant[/green]", "All users have MFA", "")
+                table.add_row(compliant, "All users have MFA", "")
             else:
-                for user in mfa_status["users_without_mfa"]:
-                    is_admin = user in mfa_status["admin_users_without_mfa"]
-                    admin_status = "[red]Yes[/red]" if is_admin else "No"
-                    table.add_row("[red]Non-compliant[/red]", user, admin_status)
+                admin_users = frozenset(mfa_status["admin_users_without_mfa"])
+                rows = [
+                    (non_compliant, user, admin_yes if user in admin_users else "No")
+                    for user in mfa_status["users_without_mfa"]
+                ]
+                for row in rows:
+                    table.add_row(*row)
                     
             console.print(table)
             
         # Display policy compliance
         if "policies" in results:
             policy_status = results["policies"]
-            console.print("\n[bold]Policy Status:[/bold]")
+            console.print("\nPolicy Status:", style="bold")
             
             table = Table(show_header=True, header_style="bold")
             table.add_column("Status")
             table.add_column("Policy Name")
             
             if policy_status["compliant"]:
-                table.add_row("[green]Compliant[/green]", "No overly permissive policies found")
+                table.add_row(compliant, "No overly permissive policies found")
             else:
                 for policy in policy_status["overly_permissive_policies"]:
-                    table.add_row("[red]Non-compliant[/red]", policy)
+                    table.add_row(non_compliant, policy)
                     
             console.print(table)
     else:
@@ -695,11 +857,16 @@ def _export_compliance_csv(results: Dict[str, Any], service: str, standard: str,
     Export compliance results to CSV format
     """
     import csv
-    from io import StringIO
-    
-    output = StringIO()
-    writer = csv.writer(output)
     
+    # Stream rows straight to the file, or to stdout when no file is given
+    with (open(filename, 'w', newline='') if filename else contextlib.nullcontext(sys.stdout)) as f:
+        writer = csv.writer(f)
+        _write_compliance_csv_rows(writer, results, service, standard)
+
+def _write_compliance_csv_rows(writer: Any, results: Dict[str, Any], service: str, standard: str) -> None:
+    """
+    Write the compliance CSV header and rows
+    """
     # Write header
     writer.writerow(["Service", "Standard", "Resource Type", "Resource", "Status", "Issue"])
     
@@ -720,10 +887,12 @@ def _export_compliance_csv(results: Dict[str, Any], service: str, standard: str,
             if mfa_status["compliant"]:
                 writer.writerow(["iam", standard, "mfa", "all_users", "Compliant", ""])
             else:
-                for user in mfa_status["users_without_mfa"]:
-                    is_admin = user in mfa_status["admin_users_without_mfa"]
-                    issue = "Missing MFA" + (" (Admin user)" if is_admin else "")
-                    writer.writerow(["iam", standard, "mfa", user, "Non-compliant", issue])
+                admin_users = frozenset(mfa_status["admin_users_without_mfa"])
+                writer.writerows(
+                    ["iam", standard, "mfa", user, "Non-compliant",
+                     "Missing MFA (Admin user)" if user in admin_users else "Missing MFA"]
+                    for user in mfa_status["users_without_mfa"]
+                )
         
         # Process policy results
         if "policies" in results:
@@ -736,25 +905,40 @@ def _export_compliance_csv(results: Dict[str, Any], service: str, standard: str,
     else:
         # Generic handling for other services
         writer.writerow([service, standard, "unknown", "unknown", "Unknown", str(results)])
+
+def _dumps_json_bytes(data: Any) -> bytes:
+    """
+    Serialize data as indented UTF-8 JSON, using orjson when it is installed
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2).encode("utf-8")
     
-    # Write to file or print to console
-    if filename:
-        with open(filename, 'w', newline='') as f:
-            f.write(output.getvalue())
-    else:
-        console.print(output.getvalue())
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+def _dumps_json(data: Any) -> str:
+    """
+    Serialize data as an indented JSON string
+    """
+    return _dumps_json_bytes(data).decode("utf-8")
 
 def _save_compliance_report(results: Dict[str, Any], filename: str, format: str) -> None:
     """
     Save compliance results to a file
     """
+    if format == "json":
+        # Serialize up front and hand the file a single buffer
+        with open(filename, 'wb') as f:
+            f.write(_dumps_json_bytes(results))
+        return
+    
     with open(filename, 'w') as f:
-        if format == "json":
-            import json
-            json.dump(results, f, indent=2)
-        elif format == "yaml":
+        if format == "yaml":
             import yaml
-            yaml.dump(results, f)
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            yaml.dump(results, f, Dumper=dumper)
         else:
             # Default to pretty text format
             from rich.console import Console
@@ -765,9 +949,9 @@ if __name__ == "__main__":
     try:
         app()
     except KeyboardInterrupt:
-        console.print("\n[yellow]Operation cancelled by user[/yellow]")
+        get_console().print("\nOperation cancelled by user", style="warn")
         sys.exit(0)
     except Exception as e:
-        logger.exception("Unhandled exception")
-        console.print(f"\n[bold red]Error: {str(e)}[/bold red]")
+        get_logger().exception("Unhandled exception")
+        get_console().print(f"\nError: {str(e)}", style="err")
         sys.exit(1) 
\ No newline at end of file
@@ -9,14 +9,311 @@ settings and templates for AWS resources.
 """
 
 import os
+import copy
+import stat
+import atexit
+import tempfile
 import yaml
 import json
 import logging
-from typing import Dict, List, Any, Optional, Set, Union
+import marshal
+import hashlib
+import functools
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from pathlib import Path
 
 from utils.logger import setup_logger
 
+# Prefer libyaml's C loader and dumper when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Install layout, resolved once at import
+_BASE_DIR = Path(__file__).resolve().parent.parent
+_CONFIG_DIR = _BASE_DIR / "config"
+_TEMPLATES_DIR = _BASE_DIR / "templates"
+
+_dirs_created = False
+
+def _ensure_dirs() -> None:
+    """
+    Create the config and templates directories, once per process
+    """
+    global _dirs_created
+    
+    if _dirs_created:
+        return
+    
+    os.makedirs(_CONFIG_DIR, exist_ok=True)
+    os.makedirs(_TEMPLATES_DIR, exist_ok=True)
+    _dirs_created = True
+
+# Default configuration; the path entries left as None are filled in by
+# ConfigManager.create_default_config
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Dict[str, Any]] = {
+    "general": {
+        "log_level": "info",
+        "log_directory": None,
+        "state_file": None
+    },
+    "aws": {
+        "region": "us-east-1",
+        "profile": "default",
+        "retry_max_attempts": 5,
+        "retry_mode": "adaptive"
+    },
+    "ui": {
+        "color_scheme": "default",
+        "show_progress_bars": True,
+        "prompt_confirmations": True
+    },
+    "templates": {
+        "directory": None
+    },
+    "security": {
+        "encrypt_state_file": True,
+        "credentials_timeout": 3600
+    }
+}
+
+def _current_umask() -> int:
+    """
+    Read the process umask
+    
+    Returns:
+        The umask
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+# Mode for newly written files, as open() would create them; read once at
+# import because reading the umask briefly changes it
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+def _write_yaml_atomic(file_path: str, data: Dict[str, Any]) -> None:
+    """
+    Dump data to a YAML file without ever leaving a partially written file
+    
+    The data is written and fsynced to a temporary file next to the target,
+    which then replaces the target in a single rename.
+    
+    Args:
+        file_path: Path to the YAML file
+        data: Data to save
+    """
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    # A unique temporary file per write, so concurrent writers to the same
+    # target can't clobber or rename each other's partial output
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory or ".",
+        prefix=f".{os.path.basename(file_path)}.",
+        suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            # mkstemp creates the file 0600; keep the permissions a plain write would give
+            try:
+                mode = stat.S_IMODE(os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                mode = _NEW_FILE_MODE
+            os.chmod(tmp_path, mode)
+            
+            yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_YAML_RESOLVER = yaml.resolver.Resolver()
+
+def _scalar_tag(event: yaml.ScalarEvent) -> str:
+    """
+    Resolve the tag of a scalar the way the loader would
+    
+    Args:
+        event: Scalar parse event
+        
+    Returns:
+        The scalar's tag, e.g. tag:yaml.org,2002:str for strings
+    """
+    if event.tag is None or event.tag == "!":
+        return _YAML_RESOLVER.resolve(yaml.ScalarNode, event.value, event.implicit)
+    return event.tag
+
+def _read_yaml_description(path: str) -> Optional[str]:
+    """
+    Read the top-level description of a YAML file without loading all of it
+    
+    Only the top-level mapping is walked, so large resource lists further
+    down are never turned into Python objects.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        The description ("" if there is none), or None when it can't be read
+        from the event stream and the file should be loaded in full
+    """
+    depth = 0
+    expecting_key = True
+    key = None
+    description = ""
+    
+    with open(path, "r") as f:
+        for event in yaml.parse(f, Loader=_YAML_LOADER):
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                if depth == 0 and not isinstance(event, yaml.MappingStartEvent):
+                    return None
+                if depth == 1:
+                    # A nested value is skipped over; complex keys and a
+                    # non-scalar description need a full load
+                    if expecting_key or key == "description":
+                        return None
+                    expecting_key = True
+                depth += 1
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+                if depth == 0:
+                    return description
+            elif depth == 1 and isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+                if expecting_key:
+                    # Merge keys can bring in a description from elsewhere
+                    if isinstance(event, yaml.AliasEvent) or event.value == "<<":
+                        return None
+                    key = event.value
+                    expecting_key = False
+                elif key == "description":
+                    if isinstance(event, yaml.AliasEvent) or _scalar_tag(event) != _STR_TAG:
+                        return None
+                    # Keep scanning: with duplicate keys the last one wins
+                    description = event.value
+                    expecting_key = True
+                else:
+                    expecting_key = True
+    
+    return description
+
+# Parsed YAML is also marshalled here so later processes can skip the parser;
+# set AWS_RESOURCE_MANAGER_YAML_CACHE_DISABLE=1 to turn this off
+_YAML_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "aws_resource_manager", "yaml")
+
+def _yaml_cache_path(path: str) -> Optional[str]:
+    """
+    Get the sidecar path for a YAML file
+    
+    Args:
+        path: Absolute path to the YAML file
+        
+    Returns:
+        Path to the sidecar, or None if the sidecar cache is disabled
+    """
+    if os.environ.get("AWS_RESOURCE_MANAGER_YAML_CACHE_DISABLE"):
+        return None
+    
+    key = hashlib.blake2b(path.encode(), digest_size=16).hexdigest()
+    return os.path.join(_YAML_CACHE_DIR, f"{key}.marshal")
+
+def _is_private(path: str) -> bool:
+    """
+    Check that a cache path belongs to the current user and nobody else can write to it
+    
+    Args:
+        path: File or directory path
+        
+    Returns:
+        True if the path can be trusted, False otherwise
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    
+    if stat.S_ISLNK(st.st_mode) or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        return False
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+def _discard_yaml_sidecars(path: Optional[str] = None) -> None:
+    """
+    Delete the sidecar of one YAML file, or all sidecars
+    
+    Args:
+        path: Absolute path to the YAML file, or None for every file
+    """
+    try:
+        if path is not None:
+            cache_path = _yaml_cache_path(path)
+            if cache_path:
+                os.remove(cache_path)
+            return
+        
+        with os.scandir(_YAML_CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".marshal"):
+                    os.remove(entry.path)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=512)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, memoized on its path, modification time and size
+    
+    Across processes the parse is reused through a marshal sidecar, which is
+    only trusted while it records the same modification time and size. Only
+    plain data goes into the sidecar; files with values marshal can't hold
+    (such as timestamps) are simply parsed every time.
+    
+    Args:
+        path: Absolute path to the YAML file
+        mtime_ns: Modification time of the file, used only as part of the cache key
+        size: Size of the file, used only as part of the cache key
+        
+    Returns:
+        Parsed YAML data
+    """
+    cache_path = _yaml_cache_path(path)
+    
+    if cache_path and _is_private(_YAML_CACHE_DIR) and _is_private(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, cached_data = marshal.load(f)
+            if cached_key == (path, mtime_ns, size):
+                return cached_data
+        except Exception:
+            pass
+    
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    
+    if cache_path:
+        # Best effort; a failed write just means parsing again next time
+        try:
+            os.makedirs(_YAML_CACHE_DIR, mode=0o700, exist_ok=True)
+            if _is_private(_YAML_CACHE_DIR):
+                payload = marshal.dumps(((path, mtime_ns, size), data))
+                fd, tmp_path = tempfile.mkstemp(dir=_YAML_CACHE_DIR, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(payload)
+                    os.replace(tmp_path, cache_path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+        except Exception:
+            pass
+    
+    return data
+
 class ConfigManager:
     """
     Handles configuration settings and templates
@@ -34,20 +331,43 @@ class ConfigManager:
         """
         self.logger = setup_logger(__name__)
         
-        # Determine the base directory
-        self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
         # Set up paths
-        self.config_dir = os.path.join(self.base_dir, "config")
-        self.templates_dir = os.path.join(self.base_dir, "templates")
+        self.base_dir = str(_BASE_DIR)
+        self.config_dir = str(_CONFIG_DIR)
+        self.templates_dir = str(_TEMPLATES_DIR)
         
         # Ensure directories exist
-        os.makedirs(self.config_dir, exist_ok=True)
-        os.makedirs(self.templates_dir, exist_ok=True)
+        _ensure_dirs()
         
-        # Load configuration
+        # Template listings per directory, keyed by the name, mtime and size
+        # of every template file in it
+        self._templates_index: Dict[str, Tuple[Tuple[Tuple[str, str, int, int], ...], List[Dict[str, Any]]]] = {}
+        
+        # Parsed templates keyed by (service, name), tagged with the file's
+        # mtime and size so on-disk edits invalidate them; the parsed data is
+        # shared and never handed out directly
+        self._template_cache: Dict[Tuple[str, str], Tuple[int, int, Dict[str, Any]]] = {}
+        
+        # Configuration is loaded on first access (see the config property)
         self.config_file = config_file or os.path.join(self.config_dir, "settings.yaml")
-        self.config = self.load_config()
+        self._config: Optional[Dict[str, Any]] = None
+        
+        # set_config only marks the config dirty; flush() writes it out
+        self._dirty = False
+        self._flush_at_exit = False
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """
+        Configuration dictionary, loaded from the config file on first access
+        """
+        if self._config is None:
+            self._config = self.load_config()
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
     
     def load_config(self) -> Dict[str, Any]:
         """
@@ -59,14 +379,14 @@ class ConfigManager:
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, "r") as f:
-                    config = yaml.safe_load(f)
-                    self.logger.info(f"Loaded configuration from {self.config_file}")
+                    config = yaml.load(f, Loader=_YAML_LOADER)
+                    self.logger.info("Loaded configuration from %s", self.config_file)
                     return config or {}
             else:
-                self.logger.warning(f"Config file {self.config_file} not found, using defaults")
+                self.logger.warning("Config file %s not found, using defaults", self.config_file)
                 return self.create_default_config()
         except Exception as e:
-            self.logger.error(f"Error loading config: {str(e)}")
+            self.logger.error("Error loading config: %s", e)
             return self.create_default_config()
     
     def create_default_config(self) -> Dict[str, Any]:
@@ -76,40 +396,21 @@ class ConfigManager:
         Returns:
             Default configuration dictionary
         """
-        default_config = {
-            "general": {
-                "log_level": "info",
-                "log_directory": os.path.join(self.base_dir, "logs"),
-                "state_file": os.path.join(self.config_dir, "state.json")
-            },
-            "aws": {
-                "region": "us-east-1",
-                "profile": "default",
-                "retry_max_attempts": 5,
-                "retry_mode": "adaptive"
-            },
-            "ui": {
-                "color_scheme": "default",
-                "show_progress_bars": True,
-                "prompt_confirmations": True
-            },
-            "templates": {
-                "directory": self.templates_dir
-            },
-            "security": {
-                "encrypt_state_file": True,
-                "credentials_timeout": 3600
-            }
-        }
+        default_config = copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+        
+        # Fill in the install-specific paths
+        default_config["general"]["log_directory"] = os.path.join(self.base_dir, "logs")
+        default_config["general"]["state_file"] = os.path.join(self.config_dir, "state.json")
+        default_config["templates"]["directory"] = self.templates_dir
         
         # Save the default config
         try:
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
             with open(self.config_file, "w") as f:
-                yaml.dump(default_config, f, default_flow_style=False)
-                self.logger.info(f"Created default configuration at {self.config_file}")
+                yaml.dump(default_config, f, Dumper=_YAML_DUMPER, default_flow_style=False)
+                self.logger.info("Created default configuration at %s", self.config_file)
         except Exception as e:
-            self.logger.error(f"Error saving default config: {str(e)}")
+            self.logger.error("Error saving default config: %s", e)
         
         return default_config
     
@@ -151,15 +452,44 @@ class ConfigManager:
                 self.config[section] = {}
             
             self.config[section][key] = value
+            self._dirty = True
             
-            # Save the updated config
-            with open(self.config_file, "w") as f:
-                yaml.dump(self.config, f, default_flow_style=False)
-                self.logger.info(f"Updated configuration: {section}.{key}")
+            # Only managers with unsaved changes are kept alive for the exit hook
+            if not self._flush_at_exit:
+                atexit.register(self.flush)
+                self._flush_at_exit = True
+            self.logger.info("Updated configuration: %s.%s", section, key)
+            return True
+        except Exception as e:
+            self.logger.error("Error updating config: %s", e)
+            return False
+    
+    def flush(self) -> bool:
+        """
+        Write pending configuration changes to the config file
+        
+        Changes made through set_config are batched in memory and written
+        here, or automatically at interpreter exit.
+        
+        Returns:
+            True if successful (or nothing to write), False otherwise
+        """
+        if not self._dirty:
+            return True
+        
+        try:
+            _write_yaml_atomic(self.config_file, self.config)
+            self._dirty = False
             
+            if self._flush_at_exit:
+                atexit.unregister(self.flush)
+                self._flush_at_exit = False
+            self.logger.info("Saved configuration to %s", self.config_file)
+            
+            self._forget_yaml_file(self.config_file)
             return True
         except Exception as e:
-            self.logger.error(f"Error updating config: {str(e)}")
+            self.logger.error("Error saving config: %s", e)
             return False
     
     def load_yaml_file(self, file_path: str) -> Dict[str, Any]:
@@ -173,13 +503,38 @@ class ConfigManager:
             Loaded YAML data as dictionary
         """
         try:
-            with open(file_path, "r") as f:
-                data = yaml.safe_load(f)
-                return data or {}
+            path = os.path.abspath(file_path)
+            stat = os.stat(path)
+            data = _parse_yaml_cached(path, stat.st_mtime_ns, stat.st_size)
+            
+            # Callers may modify what they get back (e.g. template parameters),
+            # so hand out a copy rather than the cached object
+            return copy.deepcopy(data) if data else {}
         except Exception as e:
-            self.logger.error(f"Error loading YAML file {file_path}: {str(e)}")
+            self.logger.error("Error loading YAML file %s: %s", file_path, e)
             return {}
     
+    def clear_template_cache(self) -> None:
+        """
+        Drop cached templates, template listings and YAML parses, including
+        the on-disk sidecars, so the next lookup re-reads from disk
+        """
+        _parse_yaml_cached.cache_clear()
+        _discard_yaml_sidecars()
+        self._template_cache.clear()
+        self._templates_index.clear()
+    
+    def _forget_yaml_file(self, file_path: str) -> None:
+        """
+        Drop cached parses after writing a YAML file
+        
+        Args:
+            file_path: Path of the file that was written
+        """
+        _parse_yaml_cached.cache_clear()
+        _discard_yaml_sidecars(os.path.abspath(file_path))
+        self._template_cache.clear()
+    
     def save_yaml_file(self, file_path: str, data: Dict[str, Any]) -> bool:
         """
         Save data to YAML file
@@ -192,14 +547,13 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, "w") as f:
-                yaml.dump(data, f, default_flow_style=False)
-                self.logger.info(f"Saved YAML data to {file_path}")
+            _write_yaml_atomic(file_path, data)
+            self.logger.info("Saved YAML data to %s", file_path)
             
+            self._forget_yaml_file(file_path)
             return True
         except Exception as e:
-            self.logger.error(f"Error saving YAML file {file_path}: {str(e)}")
+            self.logger.error("Error saving YAML file %s: %s", file_path, e)
             return False
     
     def get_template(self, service: str, template_name: str) -> Optional[Dict[str, Any]]:
@@ -216,13 +570,25 @@ class ConfigManager:
         try:
             template_path = os.path.join(self.templates_dir, service, f"{template_name}.yaml")
             
-            if not os.path.exists(template_path):
-                self.logger.warning(f"Template {template_name} not found for service {service}")
+            try:
+                stat = os.stat(template_path)
+            except FileNotFoundError:
+                self.logger.warning("Template %s not found for service %s", template_name, service)
                 return None
             
-            return self.load_yaml_file(template_path)
+            key = (service, template_name)
+            cached = self._template_cache.get(key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self.logger.debug("Template cache hit: %s/%s", service, template_name)
+            else:
+                template = _parse_yaml_cached(os.path.abspath(template_path), stat.st_mtime_ns, stat.st_size)
+                cached = (stat.st_mtime_ns, stat.st_size, template or {})
+                self._template_cache[key] = cached
+            
+            # Callers fill in template parameters, so each gets its own copy
+            return copy.deepcopy(cached[2])
         except Exception as e:
-            self.logger.error(f"Error loading template {template_name} for service {service}: {str(e)}")
+            self.logger.error("Error loading template %s for service %s: %s", template_name, service, e)
             return None
     
     def get_available_templates(self, service: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
@@ -241,24 +607,30 @@ class ConfigManager:
             # If service is specified, only look in that directory
             if service:
                 service_dir = os.path.join(self.templates_dir, service)
-                if os.path.exists(service_dir) and os.path.isdir(service_dir):
-                    templates[service] = self._get_templates_in_dir(service_dir)
+                if os.path.isdir(service_dir):
+                    templates[service] = self._get_cached_templates_in_dir(service_dir)
             else:
                 # Look in all service directories
-                for item in os.listdir(self.templates_dir):
-                    service_dir = os.path.join(self.templates_dir, item)
-                    if os.path.isdir(service_dir):
-                        service_templates = self._get_templates_in_dir(service_dir)
+                with os.scandir(self.templates_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+                        
+                        service_templates = self._get_cached_templates_in_dir(entry.path)
                         if service_templates:
-                            templates[item] = service_templates
+                            templates[entry.name] = service_templates
         except Exception as e:
-            self.logger.error(f"Error getting available templates: {str(e)}")
+            self.logger.error("Error getting available templates: %s", e)
         
         return templates
     
-    def _get_templates_in_dir(self, directory: str) -> List[Dict[str, Any]]:
+    def _get_cached_templates_in_dir(self, directory: str) -> List[Dict[str, Any]]:
         """
-        Get templates in a directory
+        Get templates in a directory, reusing the previous scan while no
+        template file was added, removed or changed
+        
+        Editing a file in place doesn't change the directory's mtime, so the
+        listing is keyed on every file's mtime and size instead.
         
         Args:
             directory: Directory to search for templates
@@ -266,28 +638,73 @@ class ConfigManager:
         Returns:
             List of template metadata
         """
-        templates = []
+        signature = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith((".yaml", ".yml")) and entry.is_file():
+                    stat = entry.stat()
+                    signature.append((entry.name, entry.path, stat.st_mtime_ns, stat.st_size))
+        signature.sort()
+        key = tuple(signature)
         
-        for filename in os.listdir(directory):
-            if filename.endswith(".yaml") or filename.endswith(".yml"):
-                template_path = os.path.join(directory, filename)
-                try:
-                    # Load the template
-                    template_data = self.load_yaml_file(template_path)
-                    
-                    # Extract template metadata
-                    template_name = os.path.splitext(filename)[0]
-                    template_metadata = {
-                        "name": template_name,
-                        "description": template_data.get("description", ""),
-                        "path": template_path
-                    }
-                    
-                    templates.append(template_metadata)
-                except Exception as e:
-                    self.logger.error(f"Error loading template {filename}: {str(e)}")
+        cached = self._templates_index.get(directory)
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
         
-        return templates
+        templates = self._get_templates_in_dir([(name, path) for name, path, _, _ in signature])
+        self._templates_index[directory] = (key, templates)
+        return list(templates)
+    
+    def _get_templates_in_dir(self, template_files: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Get the listing metadata for a directory's template files
+        
+        Args:
+            template_files: (filename, path) of each template file
+            
+        Returns:
+            List of template metadata
+        """
+        # Reading the files is I/O bound, so overlap them unless there are
+        # too few for a thread pool to pay off
+        if len(template_files) < 4:
+            results = [self._get_template_metadata(*item) for item in template_files]
+        else:
+            with ThreadPoolExecutor(max_workers=min(16, len(template_files))) as executor:
+                results = list(executor.map(lambda item: self._get_template_metadata(*item), template_files))
+        
+        return [template_metadata for template_metadata in results if template_metadata is not None]
+    
+    def _get_template_metadata(self, filename: str, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the listing metadata for a template file
+        
+        Args:
+            filename: Name of the template file
+            path: Path to the template file
+            
+        Returns:
+            Template metadata, or None if the template couldn't be read
+        """
+        try:
+            # Only the description is needed for the listing
+            try:
+                description = _read_yaml_description(path)
+            except yaml.YAMLError:
+                description = None
+            
+            if description is None:
+                description = self.load_yaml_file(path).get("description", "")
+            
+            # Extract template metadata
+            return {
+                "name": os.path.splitext(filename)[0],
+                "description": description,
+                "path": path
+            }
+        except Exception as e:
+            self.logger.error("Error loading template %s: %s", filename, e)
+            return None
     
     def create_template_from_resources(
         self,
@@ -310,40 +727,41 @@ class ConfigManager:
         """
         try:
             # Group resources by service
-            resources_by_service: Dict[str, List[Dict[str, Any]]] = {}
+            resources_by_service: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
             
             for resource in resources:
-                service = resource["service"]
-                if service not in resources_by_service:
-                    resources_by_service[service] = []
-                
-                resources_by_service[service].append(resource)
+                resources_by_service[resource["service"]].append(resource)
             
-            # Create a template for each service
-            template_paths = []
+            # Build a template for each service
+            work = []
             
             for service, service_resources in resources_by_service.items():
-                # Create service directory if it doesn't exist
-                service_dir = os.path.join(output_path, service)
-                os.makedirs(service_dir, exist_ok=True)
-                
-                # Create the template
                 template_data = {
                     "name": name,
                     "description": description,
                     "resources": [resource["details"] for resource in service_resources]
                 }
                 
-                # Save the template
-                template_path = os.path.join(service_dir, f"{name}.yaml")
-                if self.save_yaml_file(template_path, template_data):
-                    template_paths.append(template_path)
+                template_path = os.path.join(output_path, service, f"{name}.yaml")
+                work.append((template_path, template_data))
+            
+            # Save the templates; the writes are I/O bound, so overlap them
+            template_paths = []
+            
+            if work:
+                with ThreadPoolExecutor(max_workers=min(8, len(work))) as executor:
+                    results = list(executor.map(lambda item: self.save_yaml_file(*item), work))
+                
+                template_paths = [path for (path, _), saved in zip(work, results) if saved]
             
             if not template_paths:
-                self.logger.error(f"Failed to create any templates")
+                self.logger.error("Failed to create any templates")
                 return None
             
+            # New templates may have landed in a listed directory
+            self._templates_index.clear()
+            
             return template_paths[0]  # Return the first template path
         except Exception as e:
-            self.logger.error(f"Error creating template from resources: {str(e)}")
+            self.logger.error("Error creating template from resources: %s", e)
             return None 
\ No newline at end of file
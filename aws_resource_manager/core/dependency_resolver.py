@@ -8,12 +8,72 @@ This module provides functionality to determine dependencies between AWS resourc
 and manage the creation and deletion order to ensure integrity.
 """
 
+import sys
 import logging
-import networkx as nx
-from typing import Dict, List, Any, Optional, Set, Tuple
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Set, Tuple, FrozenSet, Mapping
 
 from utils.logger import setup_logger
 
+def _freeze_rules(rules: Dict[str, List[str]]) -> Mapping[str, FrozenSet[str]]:
+    """
+    Freeze dependency rules into a read-only mapping of interned names
+    
+    Args:
+        rules: Dictionary mapping service to list of services it depends on
+        
+    Returns:
+        Read-only mapping of service to the services it depends on
+    """
+    return MappingProxyType({
+        sys.intern(service): frozenset(sys.intern(dependency) for dependency in dependencies)
+        for service, dependencies in rules.items()
+    })
+
+def _build_reverse_rules(rules: Mapping[str, FrozenSet[str]]) -> Mapping[str, Tuple[str, ...]]:
+    """
+    Invert the dependency rules
+    
+    Args:
+        rules: Mapping of service to services it depends on
+        
+    Returns:
+        Read-only mapping of service to services that depend on it
+    """
+    reverse_rules: Dict[str, List[str]] = {}
+    for service, dependencies in rules.items():
+        for dependency in sorted(dependencies):
+            reverse_rules.setdefault(dependency, []).append(service)
+    
+    return MappingProxyType({service: tuple(dependents) for service, dependents in reverse_rules.items()})
+
+# Dependency rules for AWS services, shared by every resolver
+# Key: service, Value: services it depends on
+_DEPENDENCY_RULES = _freeze_rules({
+    "vpc": [],
+    "subnet": ["vpc"],
+    "security_group": ["vpc"],
+    "internet_gateway": ["vpc"],
+    "nat_gateway": ["subnet", "internet_gateway"],
+    "route_table": ["vpc"],
+    "ec2": ["subnet", "security_group"],
+    "rds": ["subnet", "security_group"],
+    "elasticache": ["subnet", "security_group"],
+    "elb": ["subnet", "security_group"],
+    "lambda": ["security_group"],
+    "ecs": ["vpc", "security_group"],
+    "eks": ["vpc", "subnet", "security_group"],
+    "s3": [],
+    "dynamodb": [],
+    "sqs": [],
+    "sns": [],
+    "iam": []
+})
+
+# Key: service, Value: services that depend on it
+_REVERSE_DEPENDENCY_RULES = _build_reverse_rules(_DEPENDENCY_RULES)
+
 class DependencyResolver:
     """
     Manages dependencies between AWS resources
@@ -27,37 +87,8 @@ class DependencyResolver:
         Initialize the dependency resolver
         """
         self.logger = setup_logger(__name__)
-        self.dependency_rules = self._initialize_dependency_rules()
-    
-    def _initialize_dependency_rules(self) -> Dict[str, List[str]]:
-        """
-        Initialize dependency rules between services
-        
-        Returns:
-            Dictionary mapping service to list of services it depends on
-        """
-        # Define the dependency rules for AWS services
-        # Key: service, Value: list of services it depends on
-        return {
-            "vpc": [],
-            "subnet": ["vpc"],
-            "security_group": ["vpc"],
-            "internet_gateway": ["vpc"],
-            "nat_gateway": ["subnet", "internet_gateway"],
-            "route_table": ["vpc"],
-            "ec2": ["subnet", "security_group"],
-            "rds": ["subnet", "security_group"],
-            "elasticache": ["subnet", "security_group"],
-            "elb": ["subnet", "security_group"],
-            "lambda": ["security_group"],
-            "ecs": ["vpc", "security_group"],
-            "eks": ["vpc", "subnet", "security_group"],
-            "s3": [],
-            "dynamodb": [],
-            "sqs": [],
-            "sns": [],
-            "iam": []
-        }
+        self.dependency_rules = _DEPENDENCY_RULES
+        self._reverse_rules = _REVERSE_DEPENDENCY_RULES
     
     def check_dependencies(self, service: str, template: Optional[Dict[str, Any]] = None) -> List[str]:
         """
@@ -70,25 +101,27 @@ class DependencyResolver:
         Returns:
             List of dependency issues (empty if dependencies are met)
         """
-        if service not in self.dependency_rules:
-            self.logger.warning(f"No dependency rules defined for service {service}")
-            return []
+        required_services = self.dependency_rules.get(service)
         
-        dependency_issues = []
-        required_services = self.dependency_rules.get(service, [])
+        if required_services is None:
+            self.logger.warning("No dependency rules defined for service %s", service)
+            return []
         
         if not required_services:
             return []
         
         if template:
             # Check if template provides required dependencies
-            for required_service in required_services:
-                if required_service not in template.get("dependencies", {}):
-                    dependency_issues.append(f"Missing dependency: {required_service}")
+            provided = template.get("dependencies") or {}
+            dependency_issues = [
+                f"Missing dependency: {required_service}"
+                for required_service in sorted(required_services)
+                if required_service not in provided
+            ]
         else:
             # Indicate that dependencies are required
             dependency_issues = [
-                f"Service {service} requires these dependencies: {', '.join(required_services)}"
+                f"Service {service} requires these dependencies: {', '.join(sorted(required_services))}"
             ]
         
         return dependency_issues
@@ -108,6 +141,44 @@ class DependencyResolver:
         # In a real system, you would query for actual dependencies
         return []
     
+    def _build_dependency_graph(self, resources: List[Dict[str, Any]]) -> Tuple[List[int], List[List[int]]]:
+        """
+        Build the dependency graph between resources
+        
+        Args:
+            resources: List of resource configurations
+            
+        Returns:
+            Tuple of (in-degree per resource, dependent resource indices per resource)
+        """
+        count = len(resources)
+        
+        # Bucket resource indices by service so edges can be built
+        # without comparing every pair of resources. Service names are
+        # interned so bucket lookups match the rule keys by identity.
+        by_service: Dict[str, List[int]] = {}
+        for i, resource in enumerate(resources):
+            service = resource.get("service")
+            if isinstance(service, str):
+                service = sys.intern(service)
+            by_service.setdefault(service, []).append(i)
+        
+        # Edges run from each dependency to the resources that need it
+        in_degree = [0] * count
+        dependents: List[List[int]] = [[] for _ in range(count)]
+        for service, indices in by_service.items():
+            for dependent_service in self._reverse_rules.get(service, ()):
+                dependent_indices = by_service.get(dependent_service)
+                if not dependent_indices:
+                    continue
+                
+                for j in indices:
+                    dependents[j].extend(dependent_indices)
+                for i in dependent_indices:
+                    in_degree[i] += len(indices)
+        
+        return in_degree, dependents
+    
     def sort_resources_by_dependencies(self, resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Sort resources by dependencies to determine creation order
@@ -119,53 +190,74 @@ class DependencyResolver:
             Sorted list of resources in creation order
         """
         try:
-            # Create a directed graph
-            G = nx.DiGraph()
+            count = len(resources)
+            in_degree, dependents = self._build_dependency_graph(resources)
             
-            # Add nodes for all resources
-            for i, resource in enumerate(resources):
-                G.add_node(i, resource=resource)
+            # Kahn's algorithm; ties keep the original order
+            queue = deque(i for i in range(count) if in_degree[i] == 0)
+            sorted_indices = []
+            while queue:
+                j = queue.popleft()
+                sorted_indices.append(j)
+                for i in dependents[j]:
+                    in_degree[i] -= 1
+                    if in_degree[i] == 0:
+                        queue.append(i)
             
-            # Add edges for dependencies
-            for i, resource in enumerate(resources):
-                service = resource.get("service")
-                if service not in self.dependency_rules:
-                    continue
-                
-                # Get dependencies for this service
-                required_services = self.dependency_rules.get(service, [])
-                
-                if not required_services:
-                    continue
+            # Anything left over is part of a cycle
+            if len(sorted_indices) < count:
+                self.logger.error("Dependency cycle detected in resources")
+                sorted_indices.extend(i for i in range(count) if in_degree[i] > 0)
+            
+            return [resources[i] for i in sorted_indices]
+        
+        except Exception as e:
+            self.logger.exception("Error sorting resources by dependencies: %s", e)
+            return resources
+    
+    def group_resources_by_level(self, resources: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Group resources into dependency levels
+        
+        Every resource in a level depends only on resources in earlier levels,
+        so the resources within one level can be created independently.
+        
+        Args:
+            resources: List of resource configurations
+            
+        Returns:
+            List of levels in creation order, each a list of resources
+        """
+        try:
+            count = len(resources)
+            in_degree, dependents = self._build_dependency_graph(resources)
+            
+            # Kahn's algorithm, one frontier at a time
+            levels = []
+            placed = 0
+            frontier = [i for i in range(count) if in_degree[i] == 0]
+            while frontier:
+                levels.append(frontier)
+                placed += len(frontier)
                 
-                # Find resources that this resource depends on
-                for j, other_resource in enumerate(resources):
-                    other_service = other_resource.get("service")
-                    if other_service in required_services:
-                        # This resource depends on the other resource
-                        G.add_edge(j, i)
+                next_frontier = []
+                for j in frontier:
+                    for i in dependents[j]:
+                        in_degree[i] -= 1
+                        if in_degree[i] == 0:
+                            next_frontier.append(i)
+                frontier = sorted(next_frontier)
             
-            # Check for cycles
-            if not nx.is_directed_acyclic_graph(G):
+            # Anything left over is part of a cycle; create it last
+            if placed < count:
                 self.logger.error("Dependency cycle detected in resources")
-                # Break cycles by removing edges
-                cycles = list(nx.simple_cycles(G))
-                for cycle in cycles:
-                    if cycle:
-                        G.remove_edge(cycle[0], cycle[-1])
+                levels.append([i for i in range(count) if in_degree[i] > 0])
             
-            # Perform topological sort to get creation order
-            try:
-                sorted_indices = list(nx.topological_sort(G))
-                sorted_resources = [resources[i] for i in sorted_indices]
-                return sorted_resources
-            except nx.NetworkXUnfeasible:
-                self.logger.error("Could not perform topological sort, returning original order")
-                return resources
+            return [[resources[i] for i in level] for level in levels]
         
         except Exception as e:
-            self.logger.exception(f"Error sorting resources by dependencies: {str(e)}")
-            return resources
+            self.logger.exception("Error grouping resources by dependencies: %s", e)
+            return [[resource] for resource in resources]
     
     def check_deletion_safety(self, service: str, resource_id: str) -> Tuple[bool, List[str]]:
         """
@@ -9,8 +9,10 @@ including creation, updating, deletion, listing, and exporting.
 """
 
 import os
+import sys
 import logging
-from typing import Dict, List, Any, Optional, Set, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from typing import Dict, List, Any, Optional, Set, Tuple, FrozenSet
 from dataclasses import dataclass
 
 from core.plugin_manager import PluginManager
@@ -18,7 +20,39 @@ from core.config_manager import ConfigManager
 from core.dependency_resolver import DependencyResolver
 from utils.logger import setup_logger
 
-@dataclass
+# Configured once at import and shared by every engine instance
+logger = setup_logger(__name__)
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_DEFAULT_WORKERS = 32
+
+def _worker_count() -> int:
+    """
+    Get the size of the engine's thread pool from RESOURCE_ENGINE_WORKERS
+    
+    Returns:
+        Number of worker threads, at least 1
+    """
+    value = os.environ.get("RESOURCE_ENGINE_WORKERS")
+    if value is None:
+        return _DEFAULT_WORKERS
+    
+    try:
+        workers = int(value)
+    except ValueError:
+        logger.warning(
+            "Ignoring invalid RESOURCE_ENGINE_WORKERS=%r, using %d", value, _DEFAULT_WORKERS
+        )
+        return _DEFAULT_WORKERS
+    
+    if workers < 1:
+        logger.warning("RESOURCE_ENGINE_WORKERS=%d is below 1, using 1", workers)
+        return 1
+    return workers
+
+@dataclass(**_DATACLASS_OPTIONS)
 class OperationResult:
     """Class to represent the result of an operation"""
     success: bool
@@ -50,7 +84,77 @@ class ResourceEngine:
         self.config_manager = config_manager
         self.plugin_manager = plugin_manager
         self.dependency_resolver = dependency_resolver
-        self.logger = setup_logger(__name__)
+        self.logger = logger
+        
+        # Service modules resolved so far, keyed by service name
+        self._service_module_cache: Dict[str, Any] = {}
+        
+        # Operation sets and service names per service module
+        self._ops_by_module: Dict[Any, FrozenSet[str]] = {}
+        self._name_by_module: Dict[Any, str] = {}
+        
+        # Shared pool for concurrent AWS calls; threads are started on demand
+        self._executor = ThreadPoolExecutor(
+            max_workers=_worker_count(),
+            thread_name_prefix="resource-engine"
+        )
+    
+    def close(self) -> None:
+        """
+        Shut down the engine's worker threads
+        
+        Waits for any operations still in flight to finish.
+        """
+        self._executor.shutdown(wait=True)
+    
+    def _get_service_module(self, service: str) -> Optional[Any]:
+        """
+        Get a service module, caching the plugin manager lookup
+        
+        Args:
+            service: The AWS service (e.g., ec2, s3, rds)
+            
+        Returns:
+            The service module, or None if not found
+        """
+        service_module = self._service_module_cache.get(service)
+        if service_module is None:
+            service_module = self.plugin_manager.get_service_module(service)
+            if service_module is not None:
+                self._service_module_cache[service] = service_module
+        return service_module
+    
+    def _operations(self, module: Any) -> FrozenSet[str]:
+        """
+        Get the operations a service module supports, caching the result
+        
+        Args:
+            module: The service module
+            
+        Returns:
+            Set of operation names
+        """
+        operations = self._ops_by_module.get(module)
+        if operations is None:
+            operations = frozenset(module.get_operations())
+            self._ops_by_module[module] = operations
+        return operations
+    
+    def _service_name(self, module: Any) -> str:
+        """
+        Get the service name of a service module, caching the result
+        
+        Args:
+            module: The service module
+            
+        Returns:
+            The service name
+        """
+        service = self._name_by_module.get(module)
+        if service is None:
+            service = module.get_service_name()
+            self._name_by_module[module] = service
+        return service
     
     def create_resource(
         self,
@@ -76,10 +180,10 @@ class ResourceEngine:
             OperationResult with success/failure and details
         """
         try:
-            self.logger.info(f"Creating {service} resource")
+            self.logger.info("Creating %s resource", service)
             
             # Get the service module
-            service_module = self.plugin_manager.get_service_module(service)
+            service_module = self._get_service_module(service)
             if not service_module:
                 return OperationResult(
                     success=False,
@@ -106,6 +210,47 @@ class ResourceEngine:
                     )
             
             # Perform the creation
+            return self._create_resource_fast(
+                service_module, service, resource_name, template_config, guided, dry_run
+            )
+                
+        except Exception as e:
+            self.logger.exception("Error creating %s resource", service)
+            return OperationResult(
+                success=False,
+                error_message=str(e)
+            )
+    
+    def _create_resource_fast(
+        self,
+        service_module: Any,
+        service: str,
+        resource_name: Optional[str],
+        template_config: Optional[Dict[str, Any]],
+        guided: bool = False,
+        dry_run: bool = False,
+        batch: bool = False
+    ) -> OperationResult:
+        """
+        Create an AWS resource from already resolved inputs
+        
+        Skips the module lookup, template loading and dependency check done by
+        create_resource, for callers that have handled those already.
+        
+        Args:
+            service_module: The service module for the resource
+            service: The AWS service (e.g., ec2, s3, rds)
+            resource_name: Optional name for the resource
+            template_config: Optional loaded template
+            guided: Whether to use guided wizard mode
+            dry_run: Whether to validate without creating
+            batch: Whether this is one item of a batch run, where per-item
+                tracebacks are only logged at DEBUG level
+            
+        Returns:
+            OperationResult with success/failure and details
+        """
+        try:
             creation_params = {
                 "resource_name": resource_name,
                 "template_config": template_config,
@@ -116,20 +261,24 @@ class ResourceEngine:
             result = service_module.execute_operation("create", **creation_params)
             
             if result.get("success"):
-                self.logger.info(f"Successfully created {service} resource")
+                self.logger.info("Successfully created %s resource", service)
                 return OperationResult(
                     success=True,
                     output=result.get("output")
                 )
             else:
-                self.logger.error(f"Failed to create {service} resource: {result.get('error')}")
+                error = result.get("error")
+                self.logger.error("Failed to create %s resource: %s", service, error)
                 return OperationResult(
                     success=False,
-                    error_message=result.get("error")
+                    error_message=error
                 )
                 
         except Exception as e:
-            self.logger.exception(f"Error creating {service} resource")
+            if batch and not self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.error("Error creating %s resource: %s", service, e)
+            else:
+                self.logger.exception("Error creating %s resource", service)
             return OperationResult(
                 success=False,
                 error_message=str(e)
@@ -139,7 +288,8 @@ class ResourceEngine:
         self,
         service: str,
         output_format: str = "rich",
-        filter_expr: Optional[str] = None
+        filter_expr: Optional[str] = None,
+        page_size: Optional[int] = None
     ) -> OperationResult:
         """
         List AWS resources
@@ -148,15 +298,16 @@ class ResourceEngine:
             service: The AWS service (e.g., ec2, s3, rds)
             output_format: Output format (rich, json, yaml)
             filter_expr: Optional filter expression
+            page_size: Optional number of items to request per AWS API page
             
         Returns:
             OperationResult with success/failure and details
         """
         try:
-            self.logger.info(f"Listing {service} resources")
+            self.logger.info("Listing %s resources", service)
             
             # Get the service module
-            service_module = self.plugin_manager.get_service_module(service)
+            service_module = self._get_service_module(service)
             if not service_module:
                 return OperationResult(
                     success=False,
@@ -169,23 +320,28 @@ class ResourceEngine:
                 "filter_expr": filter_expr
             }
             
+            # Only pass page_size when set, so modules without paging support still work
+            if page_size is not None:
+                list_params["page_size"] = page_size
+            
             result = service_module.execute_operation("list", **list_params)
             
             if result.get("success"):
-                self.logger.info(f"Successfully listed {service} resources")
+                self.logger.info("Successfully listed %s resources", service)
                 return OperationResult(
                     success=True,
                     output=result.get("output")
                 )
             else:
-                self.logger.error(f"Failed to list {service} resources: {result.get('error')}")
+                error = result.get("error")
+                self.logger.error("Failed to list %s resources: %s", service, error)
                 return OperationResult(
                     success=False,
-                    error_message=result.get("error")
+                    error_message=error
                 )
                 
         except Exception as e:
-            self.logger.exception(f"Error listing {service} resources")
+            self.logger.exception("Error listing %s resources", service)
             return OperationResult(
                 success=False,
                 error_message=str(e)
@@ -213,10 +369,10 @@ class ResourceEngine:
             OperationResult with success/failure and details
         """
         try:
-            self.logger.info(f"Updating {service} resource {resource_id}")
+            self.logger.info("Updating %s resource %s", service, resource_id)
             
             # Get the service module
-            service_module = self.plugin_manager.get_service_module(service)
+            service_module = self._get_service_module(service)
             if not service_module:
                 return OperationResult(
                     success=False,
@@ -234,20 +390,21 @@ class ResourceEngine:
             result = service_module.execute_operation("update", **update_params)
             
             if result.get("success"):
-                self.logger.info(f"Successfully updated {service} resource {resource_id}")
+                self.logger.info("Successfully updated %s resource %s", service, resource_id)
                 return OperationResult(
                     success=True,
                     output=result.get("output")
                 )
             else:
-                self.logger.error(f"Failed to update {service} resource {resource_id}: {result.get('error')}")
+                error = result.get("error")
+                self.logger.error("Failed to update %s resource %s: %s", service, resource_id, error)
                 return OperationResult(
                     success=False,
-                    error_message=result.get("error")
+                    error_message=error
                 )
                 
         except Exception as e:
-            self.logger.exception(f"Error updating {service} resource {resource_id}")
+            self.logger.exception("Error updating %s resource %s", service, resource_id)
             return OperationResult(
                 success=False,
                 error_message=str(e)
@@ -273,10 +430,10 @@ class ResourceEngine:
             OperationResult with success/failure and details
         """
         try:
-            self.logger.info(f"Deleting {service} resource {resource_id}")
+            self.logger.info("Deleting %s resource %s", service, resource_id)
             
             # Get the service module
-            service_module = self.plugin_manager.get_service_module(service)
+            service_module = self._get_service_module(service)
             if not service_module:
                 return OperationResult(
                     success=False,
@@ -302,20 +459,21 @@ class ResourceEngine:
             result = service_module.execute_operation("delete", **delete_params)
             
             if result.get("success"):
-                self.logger.info(f"Successfully deleted {service} resource {resource_id}")
+                self.logger.info("Successfully deleted %s resource %s", service, resource_id)
                 return OperationResult(
                     success=True,
                     output=result.get("output")
                 )
             else:
-                self.logger.error(f"Failed to delete {service} resource {resource_id}: {result.get('error')}")
+                error = result.get("error")
+                self.logger.error("Failed to delete %s resource %s: %s", service, resource_id, error)
                 return OperationResult(
                     success=False,
-                    error_message=result.get("error")
+                    error_message=error
                 )
                 
         except Exception as e:
-            self.logger.exception(f"Error deleting {service} resource {resource_id}")
+            self.logger.exception("Error deleting %s resource %s", service, resource_id)
             return OperationResult(
                 success=False,
                 error_message=str(e)
@@ -325,7 +483,8 @@ class ResourceEngine:
         self,
         file_path: str,
         dry_run: bool = False,
-        ignore_errors: bool = False
+        ignore_errors: bool = False,
+        collect_results: bool = True
     ) -> OperationResult:
         """
         Create multiple AWS resources from a YAML file
@@ -334,12 +493,14 @@ class ResourceEngine:
             file_path: Path to the YAML file with resource definitions
             dry_run: Whether to validate without creating
             ignore_errors: Whether to continue on error
+            collect_results: Whether to return a result entry per resource;
+                if False, only success/failure counts are returned
             
         Returns:
             OperationResult with success/failure and details
         """
         try:
-            self.logger.info(f"Batch creating resources from {file_path}")
+            self.logger.info("Batch creating resources from %s", file_path)
             
             # Load the batch configuration
             batch_config = self.config_manager.load_yaml_file(file_path)
@@ -349,37 +510,93 @@ class ResourceEngine:
                     error_message=f"Failed to load batch configuration from {file_path}"
                 )
             
-            # Sort resources by dependencies
+            # Group resources into dependency levels
             resources = batch_config.get("resources", [])
-            sorted_resources = self.dependency_resolver.sort_resources_by_dependencies(resources)
+            levels = self.dependency_resolver.group_resources_by_level(resources)
+            
+            # Resolve each service's module once up front
+            service_modules = {
+                service: self._get_service_module(service)
+                for service in {resource.get("service") for resource in resources}
+            }
             
-            # Create resources in order
+            # Create each level concurrently, finishing it before the next
             results = []
             failures = []
-            
-            for resource in sorted_resources:
-                service = resource.get("service")
-                resource_name = resource.get("name")
+            succeeded = 0
+            failed = 0
+            
+            for level in levels:
+                # Dependencies are already handled by the grouping and batch
+                # resources don't use templates, so go straight to creation
+                futures = []
+                for resource in level:
+                    service = resource.get("service")
+                    service_module = service_modules[service]
+                    
+                    if not service_module:
+                        future = Future()
+                        future.set_result(OperationResult(
+                            success=False,
+                            error_message=f"Service module '{service}' not found"
+                        ))
+                    else:
+                        self.logger.info("Creating %s resource", service)
+                        future = self._executor.submit(
+                            self._create_resource_fast,
+                            service_module,
+                            service,
+                            resource.get("name"),
+                            None,
+                            guided=False,
+                            dry_run=dry_run,
+                            batch=True
+                        )
+                    
+                    futures.append(future)
                 
-                resource_result = self.create_resource(
-                    service=service,
-                    resource_name=resource_name,
-                    guided=False,
-                    dry_run=dry_run,
-                    skip_dependency_check=True  # Already handled by sorting
-                )
+                # On the first failure, cancel whatever hasn't started yet
+                if not ignore_errors:
+                    for future in as_completed(futures):
+                        if not future.result().success:
+                            for pending in futures:
+                                pending.cancel()
+                            break
                 
-                results.append({
-                    "service": service,
-                    "name": resource_name,
-                    "success": resource_result.success,
-                    "output": resource_result.output if resource_result.success else resource_result.error_message
-                })
+                # Let creations already in flight finish before moving on
+                wait(futures)
                 
-                if not resource_result.success and not ignore_errors:
-                    failures.append(f"{service} resource '{resource_name}': {resource_result.error_message}")
+                for resource, future in zip(level, futures):
+                    if future.cancelled():
+                        continue
+                    
+                    service = resource.get("service")
+                    resource_name = resource.get("name")
+                    resource_result = future.result()
+                    
+                    if resource_result.success:
+                        succeeded += 1
+                    else:
+                        failed += 1
+                    
+                    if collect_results:
+                        results.append({
+                            "service": service,
+                            "name": resource_name,
+                            "success": resource_result.success,
+                            "output": resource_result.output if resource_result.success else resource_result.error_message
+                        })
+                    
+                    if not resource_result.success and not ignore_errors:
+                        failures.append(f"{service} resource '{resource_name}': {resource_result.error_message}")
+                
+                # Skip the remaining levels once anything has failed
+                if failures:
                     break
             
+            if not collect_results:
+                results = {"succeeded": succeeded, "failed": failed}
+            
             if failures and not ignore_errors:
                 return OperationResult(
                     success=False,
@@ -393,7 +610,7 @@ class ResourceEngine:
             )
                 
         except Exception as e:
-            self.logger.exception(f"Error in batch resource creation")
+            self.logger.exception("Error in batch resource creation")
             return OperationResult(
                 success=False,
                 error_message=str(e)
@@ -419,12 +636,12 @@ class ResourceEngine:
             OperationResult with success/failure and details
         """
         try:
-            self.logger.info(f"Exporting resources as {export_format}")
+            self.logger.info("Exporting resources as %s", export_format)
             
             # Get all service modules that support exporting
             export_modules = [
                 module for module in self.plugin_manager.get_all_service_modules()
-                if "export" in module.get_operations()
+                if "export" in self._operations(module)
             ]
             
             if not export_modules:
@@ -433,6 +650,17 @@ class ResourceEngine:
                     error_message=f"No service modules support exporting to {export_format}"
                 )
             
+            # When every ID is qualified as "service:id", only the named
+            # services need to export, each with just its own IDs
+            ids_by_service = self._group_resource_ids_by_service(
+                resource_ids, {self._service_name(module) for module in export_modules}
+            )
+            if ids_by_service is not None:
+                export_modules = [
+                    module for module in export_modules
+                    if self._service_name(module) in ids_by_service
+                ]
+            
             export_params = {
                 "export_format": export_format,
                 "output_path": output_path,
@@ -440,33 +668,35 @@ class ResourceEngine:
                 "region": region
             }
             
-            # Export resources from each module
-            export_results = {}
+            # Export resources from all modules concurrently; results are
+            # collected in module order
+            futures = {}
             for module in export_modules:
-                service = module.get_service_name()
-                result = module.execute_operation("export", **export_params)
-                export_results[service] = result
-            
-            # Generate summary
-            successful_services = [
-                service for service, result in export_results.items() 
-                if result.get("success")
-            ]
-            
-            failed_services = {
-                service: result.get("error") 
-                for service, result in export_results.items() 
-                if not result.get("success")
-            }
-            
-            if failed_services:
-                failures_str = ", ".join([f"{service}: {error}" for service, error in failed_services.items()])
+                service = self._service_name(module)
+                module_params = export_params
+                if ids_by_service is not None:
+                    module_params = dict(export_params, resource_ids=ids_by_service[service])
+                futures[service] = self._executor.submit(module.execute_operation, "export", **module_params)
+            
+            export_results = {service: future.result() for service, future in futures.items()}
+            
+            # Generate summary in a single pass
+            successful_services = []
+            failed_pairs = []
+            for service, result in export_results.items():
+                if result.get("success"):
+                    successful_services.append(service)
+                else:
+                    failed_pairs.append((service, result.get("error")))
+            
+            if failed_pairs:
+                failures_str = ", ".join(f"{service}: {error}" for service, error in failed_pairs)
                 return OperationResult(
                     success=False,
                     error_message=f"Export partially failed: {failures_str}",
                     output={
                         "successful_services": successful_services,
-                        "failed_services": failed_services,
+                        "failed_services": dict(failed_pairs),
                         "output_path": output_path
                     }
                 )
@@ -480,12 +710,51 @@ class ResourceEngine:
             )
                 
         except Exception as e:
-            self.logger.exception(f"Error exporting resources")
+            self.logger.exception("Error exporting resources")
             return OperationResult(
                 success=False,
                 error_message=str(e)
             )
     
+    def _group_resource_ids_by_service(
+        self,
+        resource_ids: Optional[List[str]],
+        services: Set[str]
+    ) -> Optional[Dict[str, List[str]]]:
+        """
+        Group service-qualified resource IDs by service
+        
+        Args:
+            resource_ids: Resource IDs, possibly in "service:id" form
+            services: Known service names
+            
+        Returns:
+            Dictionary mapping service to its unqualified IDs, or None if there
+            are no IDs or any of them isn't qualified with a known service
+        """
+        if not resource_ids:
+            return None
+        
+        ids_by_service: Dict[str, List[str]] = {}
+        for resource_id in resource_ids:
+            service, separator, id = resource_id.partition(":")
+            if not separator or service not in services:
+                return None
+            ids_by_service.setdefault(service, []).append(id)
+        
+        return ids_by_service
+    
+    def clear_template_cache(self) -> None:
+        """
+        Drop cached templates so the next lookup re-reads them from disk
+        
+        Templates, template listings and parsed YAML are cached by the
+        configuration manager, keyed by file modification time and size, so
+        this is only needed to force a reload (e.g. after an edit that kept a
+        file's size and landed within its timestamp granularity).
+        """
+        self.config_manager.clear_template_cache()
+    
     def get_templates(self, service: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Get available templates for resource creation
@@ -499,7 +768,7 @@ class ResourceEngine:
         try:
             return self.config_manager.get_available_templates(service)
         except Exception as e:
-            self.logger.exception(f"Error getting templates")
+            self.logger.exception("Error getting templates")
             return {}
     
     def create_template(
@@ -522,41 +791,55 @@ class ResourceEngine:
             OperationResult with success/failure and details
         """
         try:
-            self.logger.info(f"Creating template '{name}' from resources {resource_ids}")
+            self.logger.info("Creating template '%s' from resources %s", name, resource_ids)
             
-            # Parse resource IDs
-            parsed_resources = []
+            # Parse resource IDs and resolve their service modules
+            lookups = []
             for resource_id in resource_ids:
                 # Expects format "service:id" (e.g., "ec2:i-12345")
-                if ":" not in resource_id:
+                service, separator, id = resource_id.partition(":")
+                if not separator:
                     return OperationResult(
                         success=False,
                         error_message=f"Invalid resource ID format: {resource_id}. Expected 'service:id'"
                     )
                 
-                service, id = resource_id.split(":", 1)
-                
                 # Get the service module
-                service_module = self.plugin_manager.get_service_module(service)
+                service_module = self._get_service_module(service)
                 if not service_module:
                     return OperationResult(
                         success=False,
                         error_message=f"Service module '{service}' not found for resource {resource_id}"
                     )
                 
-                # Get resource details
-                result = service_module.execute_operation("describe", resource_id=id)
-                if not result.get("success"):
-                    return OperationResult(
-                        success=False,
-                        error_message=f"Failed to get details for {resource_id}: {result.get('error')}"
-                    )
+                lookups.append((resource_id, service, id, service_module))
+            
+            # Get resource details concurrently, stopping at the first failure
+            parsed_resources = []
+            if lookups:
+                futures = {
+                    self._executor.submit(service_module.execute_operation, "describe", resource_id=id): resource_id
+                    for resource_id, _, id, service_module in lookups
+                }
                 
-                parsed_resources.append({
-                    "service": service,
-                    "id": id,
-                    "details": result.get("output")
-                })
+                for future in as_completed(futures):
+                    result = future.result()
+                    if not result.get("success"):
+                        for pending in futures:
+                            pending.cancel()
+                        return OperationResult(
+                            success=False,
+                            error_message=f"Failed to get details for {futures[future]}: {result.get('error')}"
+                        )
+                
+                parsed_resources = [
+                    {
+                        "service": service,
+                        "id": id,
+                        "details": future.result().get("output")
+                    }
+                    for future, (_, service, id, _) in zip(futures, lookups)
+                ]
             
             # Create template from resources
             template_path = self.config_manager.create_template_from_resources(
@@ -578,7 +861,7 @@ class ResourceEngine:
             )
                 
         except Exception as e:
-            self.logger.exception(f"Error creating template")
+            self.logger.exception("Error creating template")
             return OperationResult(
                 success=False,
                 error_message=str(e)
@@ -592,25 +875,29 @@ class ResourceEngine:
             List of permission issues (empty if all permissions are granted)
         """
         try:
-            # Get all service modules
-            service_modules = self.plugin_manager.get_all_service_modules()
+            # Get the service modules that have a permission check
+            modules = [
+                module for module in self.plugin_manager.get_all_service_modules()
+                if "check_permissions" in self._operations(module)
+            ]
             
-            # Check permissions for each module
-            permission_issues = []
-            for module in service_modules:
-                service = module.get_service_name()
-                
-                # Skip modules that don't have permission check
-                if "check_permissions" not in module.get_operations():
-                    continue
-                
-                # Check permissions
-                result = module.execute_operation("check_permissions")
-                if not result.get("success"):
-                    permission_issues.append(f"{service}: {result.get('error')}")
+            if not modules:
+                return []
+            
+            # Check permissions for each module concurrently
+            results = list(self._executor.map(
+                lambda module: (self._service_name(module), module.execute_operation("check_permissions")),
+                modules
+            ))
+            
+            permission_issues = [
+                f"{service}: {result.get('error')}"
+                for service, result in results
+                if not result.get("success")
+            ]
             
             return permission_issues
                 
         except Exception as e:
-            self.logger.exception(f"Error checking permissions")
+            self.logger.exception("Error checking permissions")
             return [f"Error checking permissions: {str(e)}"] 
\ No newline at end of file
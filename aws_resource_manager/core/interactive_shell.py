@@ -7,25 +7,343 @@ Interactive Shell for AWS Resource Manager
 This module provides an interactive shell interface for the AWS Resource Manager.
 """
 
+import io
 import os
 import sys
+import json
 import shlex
+import queue
+import atexit
 import logging
-from typing import List, Dict, Any, Optional, Callable
+import argparse
+import datetime
+import threading
+import time
+import functools
+from typing import List, Dict, Any, Optional, Callable, Set
 
 from prompt_toolkit import PromptSession
-from prompt_toolkit.history import FileHistory
+from prompt_toolkit.history import FileHistory, ThreadedHistory
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-from prompt_toolkit.completion import WordCompleter
+from prompt_toolkit.completion import NestedCompleter, WordCompleter
 from prompt_toolkit.styles import Style
 from prompt_toolkit.formatted_text import HTML
-from rich.console import Console
+from prompt_toolkit.shortcuts import confirm
+from rich.console import Console, Group
 from rich.table import Table
+from rich.tree import Tree
+from rich.text import Text
+from rich.style import Style as RichStyle
 from rich.panel import Panel
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
+def _get_yaml():
+    """
+    Import yaml on first use, keeping it off the shell's startup path.
+    
+    Returns:
+        module: The yaml module
+    """
+    import yaml
+    return yaml
+
+def _dump_yaml(data: Any, stream) -> None:
+    """
+    Write data as YAML, using libyaml's C dumper when available.
+    
+    Args:
+        data: The data to serialize
+        stream: File-like object to write to
+    """
+    yaml = _get_yaml()
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    yaml.dump(data, stream, Dumper=dumper, default_flow_style=False)
+
+def _add_tree_nodes(parent: Tree, node: Any) -> None:
+    """
+    Add a nested dict/list value to a tree as child nodes.
+    
+    A boolean "compliant" key is shown as a colored status line.
+    
+    Args:
+        parent: The tree node to add to
+        node: The value to add
+    """
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "compliant" and isinstance(value, bool):
+                parent.add("[green]Compliant[/green]" if value else "[red]Non-compliant[/red]")
+            elif isinstance(value, (dict, list)):
+                _add_tree_nodes(parent.add(f"[bold]{key}[/bold]"), value)
+            else:
+                parent.add(f"{key}: {value}")
+    elif isinstance(node, list):
+        for item in node:
+            if isinstance(item, (dict, list)):
+                _add_tree_nodes(parent.add("-"), item)
+            else:
+                parent.add(str(item))
+    else:
+        parent.add(str(node))
+
+def _shell_errors(message: str) -> Callable:
+    """
+    Decorate a shell command so unexpected errors are logged and reported
+    instead of ending the shell.
+    
+    Args:
+        message: Error message prefix, e.g. "Error creating resource"
+        
+    Returns:
+        Callable: The decorator
+    """
+    def decorator(func: Callable[["InteractiveShell", List[str]], bool]) -> Callable[["InteractiveShell", List[str]], bool]:
+        @functools.wraps(func)
+        def wrapper(self: "InteractiveShell", args: List[str]) -> bool:
+            try:
+                return func(self, args)
+            except Exception as e:
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.exception(message)
+                self._print_error(f"{message}: {e}")
+                return True
+        return wrapper
+    return decorator
+
+# Command history file, in the user's home directory unless
+# AWS_RESOURCE_MANAGER_HISTORY points elsewhere
+_HISTORY_PATH = (
+    os.environ.get("AWS_RESOURCE_MANAGER_HISTORY")
+    or os.path.expanduser("~/.aws_resource_manager_history")
+)
+
+# Styles for status lines, applied directly rather than parsed from markup
+_INFO_STYLE = RichStyle(color="blue", bold=True)
+_SUCCESS_STYLE = RichStyle(color="green", bold=True)
+_ERROR_STYLE = RichStyle(color="red", bold=True)
+_CATEGORY_STYLE = RichStyle(color="cyan", bold=True)
+_TEMPLATE_NAME_STYLE = RichStyle(color="yellow")
+
+# Longest wait at exit for queued history entries to be written
+_HISTORY_FLUSH_TIMEOUT = 2.0
+
+# Write buffer for compliance report files
+_REPORT_BUFFER_SIZE = 1 << 20
+
+# Inputs that leave the shell; ':q' is accepted but not offered for completion
+_EXIT_COMMANDS = frozenset(("exit", "quit", ":q"))
+
+# Characters that need shlex to split or unquote the input
+_SHLEX_SPECIAL_CHARS = frozenset(" \t\n\r\x0b\x0c'\"\\")
+
+# Input without these characters splits the same way with str.split()
+_SHLEX_QUOTE_CHARS = frozenset("'\"\\")
+
+class _BackgroundFileHistory(FileHistory):
+    """
+    File history that appends entries from a background writer thread
+    
+    Accepted commands are queued and written in batches, so the next prompt
+    doesn't wait on disk I/O. Pending entries are flushed at exit.
+    """
+    
+    def __init__(self, filename: str):
+        super().__init__(filename)
+        self._pending: "queue.Queue[str]" = queue.Queue()
+        self._writer = threading.Thread(target=self._drain, name="shell-history", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+    
+    def store_string(self, string: str) -> None:
+        self._pending.put(string)
+    
+    def flush(self, timeout: float = _HISTORY_FLUSH_TIMEOUT) -> bool:
+        """
+        Wait until every queued entry has been written.
+        
+        Args:
+            timeout: Longest time to wait, in seconds
+            
+        Returns:
+            bool: True if the queue was drained, False if the wait timed out
+        """
+        deadline = time.monotonic() + timeout
+        with self._pending.all_tasks_done:
+            while self._pending.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("Gave up waiting for shell history to be written")
+                    return False
+                self._pending.all_tasks_done.wait(remaining)
+        return True
+    
+    def _drain(self) -> None:
+        while True:
+            batch = [self._pending.get()]
+            while True:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_batch(batch)
+            except Exception:
+                # Keep the writer alive; a dead writer would leave later entries unwritten
+                logger.exception("Error writing shell history")
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+    
+    def _write_batch(self, batch: List[str]) -> None:
+        chunks = []
+        for string in batch:
+            chunks.append(f"\n# {datetime.datetime.now()}\n")
+            for line in string.split("\n"):
+                chunks.append(f"+{line}\n")
+        
+        with open(self.filename, "ab") as f:
+            # Lone surrogates can't be encoded; replace them rather than lose the batch
+            f.write("".join(chunks).encode("utf-8", errors="replace"))
+
+class ShellArgumentError(Exception):
+    """Raised when a shell command's arguments can't be parsed"""
+
+class _ShellArgumentParser(argparse.ArgumentParser):
+    """
+    Argument parser for shell commands that raises instead of exiting
+    
+    As with the shell's original hand-written parsing, an option that takes
+    a value always consumes the next token, even one starting with '-'
+    (e.g. `--filter -x`), and a trailing option with no value is ignored.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._value_options: Set[str] = set()
+    
+    def add_argument(self, *args, **kwargs) -> argparse.Action:
+        action = super().add_argument(*args, **kwargs)
+        if action.option_strings and action.nargs is None:
+            self._value_options.update(action.option_strings)
+        return action
+    
+    def parse_known_args(self, args=None, namespace=None):
+        if args is not None:
+            args = self._join_option_values(args)
+        return super().parse_known_args(args, namespace)
+    
+    def _join_option_values(self, args: List[str]) -> List[str]:
+        """
+        Attach each value option's value to it as --option=value.
+        
+        Args:
+            args: Command arguments
+            
+        Returns:
+            List[str]: Arguments argparse can't mistake for options
+        """
+        joined = []
+        tokens = iter(args)
+        for token in tokens:
+            if token in self._value_options:
+                value = next(tokens, None)
+                if value is None:
+                    break
+                token = f"{token}={value}"
+            joined.append(token)
+        return joined
+    
+    def error(self, message: str) -> None:
+        raise ShellArgumentError(message)
+
+def _new_parser(command: str, usage: str) -> _ShellArgumentParser:
+    """
+    Create an argument parser for a shell command.
+    
+    Args:
+        command: The command name
+        usage: Usage line shown when parsing fails
+        
+    Returns:
+        _ShellArgumentParser: The parser
+    """
+    return _ShellArgumentParser(prog=command, usage=usage, add_help=False, allow_abbrev=False)
+
+def _build_parsers() -> Dict[str, _ShellArgumentParser]:
+    """
+    Build the argument parsers for all shell commands.
+    
+    Returns:
+        Dict[str, _ShellArgumentParser]: Parsers keyed by command name
+    """
+    parsers = {}
+    
+    parser = _new_parser("create", "create <service> [--name <resource_name>] [--template <template>] [--guided] [--dry-run]")
+    parser.add_argument("service")
+    parser.add_argument("--name")
+    parser.add_argument("--template")
+    parser.add_argument("--guided", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+    parsers["create"] = parser
+    
+    parser = _new_parser("list", "list <service> [--output <format>] [--filter <filter_expr>]")
+    parser.add_argument("service")
+    parser.add_argument("--output", default="rich")
+    parser.add_argument("--filter")
+    parsers["list"] = parser
+    
+    parser = _new_parser("delete", "delete <service> <resource_id> [--force] [--dry-run]")
+    parser.add_argument("service")
+    parser.add_argument("resource_id")
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+    parsers["delete"] = parser
+    
+    parser = _new_parser("update", "update <service> <resource_id> [--param key=value]... [--guided] [--dry-run]")
+    parser.add_argument("service")
+    parser.add_argument("resource_id")
+    parser.add_argument("--param", action="append", default=[])
+    parser.add_argument("--guided", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+    parsers["update"] = parser
+    
+    parser = _new_parser("export", "export [--format <format>] [--output <path>] [--resource <id>]... [--region <region>]")
+    parser.add_argument("--format", default="terraform")
+    parser.add_argument("--output", default=".")
+    parser.add_argument("--resource", action="append", default=[])
+    parser.add_argument("--region")
+    parsers["export"] = parser
+    
+    parser = _new_parser("templates", "templates [--service <service>]")
+    parser.add_argument("--service")
+    parsers["templates"] = parser
+    
+    parser = _new_parser("batch", "batch <file> [--dry-run] [--ignore-errors]")
+    parser.add_argument("file")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--ignore-errors", action="store_true")
+    parsers["batch"] = parser
+    
+    parser = _new_parser(
+        "compliance",
+        "compliance <service> [--type <resource_type>] [--id <resource_id>] [--standard <standard>] "
+        "[--output <format>] [--report <file>] [--severity <level>]"
+    )
+    parser.add_argument("service")
+    parser.add_argument("--type")
+    parser.add_argument("--id")
+    parser.add_argument("--standard", default="pci-dss")
+    parser.add_argument("--output", default="rich")
+    parser.add_argument("--report")
+    parser.add_argument("--severity", default="warning")
+    parsers["compliance"] = parser
+    
+    return parsers
+
 class InteractiveShell:
     """
     Interactive shell for AWS Resource Manager.
@@ -34,6 +352,11 @@ class InteractiveShell:
     to execute AWS Resource Manager commands interactively.
     """
     
+    __slots__ = (
+        "engine", "console", "_plain_console", "session", "commands", "_parsers",
+        "_help_table", "_command_docs", "_completer_words", "completer", "style",
+    )
+    
     def __init__(self, engine):
         """
         Initialize the interactive shell.
@@ -44,12 +367,12 @@ class InteractiveShell:
         self.engine = engine
         self.console = Console()
         
-        # Command history file in user's home directory
-        history_file = os.path.expanduser('~/.aws_resource_manager_history')
+        # Command output is printed as-is, without markup parsing or highlighting
+        self._plain_console = Console(highlight=False, markup=False, soft_wrap=True)
         
         # Create prompt session with history
         self.session = PromptSession(
-            history=FileHistory(history_file),
+            history=ThreadedHistory(_BackgroundFileHistory(_HISTORY_PATH)),
             auto_suggest=AutoSuggestFromHistory()
         )
         
@@ -68,8 +391,21 @@ class InteractiveShell:
             'quit': self.cmd_exit
         }
         
-        # Create command completer
-        self.completer = WordCompleter(list(self.commands.keys()) + ['help'], ignore_case=True)
+        # Argument parsers for commands that take arguments
+        self._parsers = _build_parsers()
+        
+        # Static help content, built once
+        self._help_table = self._build_help_table()
+        self._command_docs = {
+            name: handler.__doc__ or "No help available"
+            for name, handler in self.commands.items()
+        }
+        
+        # Create command completer; 'help' also completes command names
+        self._completer_words = tuple(sorted(self.commands))
+        completions: Dict[str, Any] = dict.fromkeys(self._completer_words)
+        completions['help'] = WordCompleter(self._completer_words, ignore_case=True, WORD=True)
+        self.completer = NestedCompleter.from_nested_dict(completions)
         
         # Define styles
         self.style = Style.from_dict({
@@ -111,7 +447,7 @@ class InteractiveShell:
                 break
             except Exception as e:
                 logger.exception("Error in shell")
-                self.console.print(f"[bold red]Error: {str(e)}[/bold red]")
+                self._print_error(f"Error: {str(e)}")
     
     def process_command(self, user_input: str) -> bool:
         """
@@ -123,25 +459,98 @@ class InteractiveShell:
         Returns:
             bool: True to continue running, False to exit
         """
-        # Parse the command and arguments
-        parts = shlex.split(user_input)
-        command = parts[0].lower()
-        args = parts[1:]
+        user_input = user_input.strip()
+        if not user_input:
+            return True
+        
+        # Exit without going through parsing and dispatch
+        if user_input in _EXIT_COMMANDS:
+            return self.cmd_exit([])
+        
+        # Parse the command and arguments; shlex is only needed for quotes and escapes
+        if _SHLEX_SPECIAL_CHARS.isdisjoint(user_input):
+            command = user_input
+            args = []
+        else:
+            if _SHLEX_QUOTE_CHARS.isdisjoint(user_input):
+                tokens = user_input.split()
+            else:
+                tokens = shlex.split(user_input)
+            
+            # Interned tokens let argparse's option lookups compare by identity
+            parts = [sys.intern(token) for token in tokens]
+            command = parts[0]
+            args = parts[1:]
+        
+        # Commands are stored lowercase, so only lowercase on a miss
+        handler = self.commands.get(command)
+        if handler is None:
+            command = command.lower()
+            handler = self.commands.get(command)
         
         # Check if it's a valid command
-        if command in self.commands:
+        if handler is not None:
             try:
                 # Execute the command
-                return self.commands[command](args)
+                return handler(args)
             except Exception as e:
                 logger.exception(f"Error executing command: {command}")
-                self.console.print(f"[bold red]Error executing command: {str(e)}[/bold red]")
+                self._print_error(f"Error executing command: {str(e)}")
                 return True
         else:
-            self.console.print(f"[bold red]Unknown command: {command}[/bold red]")
+            self._print_error(f"Unknown command: {command}")
             self.console.print("Type 'help' to see available commands")
             return True
     
+    def _print_info(self, message: str) -> None:
+        """
+        Print a bold blue status line.
+        
+        Args:
+            message: The message to print
+        """
+        self.console.print(Text(message, style=_INFO_STYLE))
+    
+    def _print_success(self, message: str) -> None:
+        """
+        Print a bold green status line.
+        
+        Args:
+            message: The message to print
+        """
+        self.console.print(Text(message, style=_SUCCESS_STYLE))
+    
+    def _print_error(self, message: str) -> None:
+        """
+        Print a bold red status line.
+        
+        Args:
+            message: The message to print
+        """
+        self.console.print(Text(message, style=_ERROR_STYLE))
+    
+    def _parse_args(self, command: str, args: List[str]) -> Optional[argparse.Namespace]:
+        """
+        Parse a command's arguments, reporting any problem to the user.
+        
+        Unrecognized arguments are ignored.
+        
+        Args:
+            command: The command name
+            args: Command arguments
+            
+        Returns:
+            Optional[argparse.Namespace]: Parsed arguments, or None if parsing failed
+        """
+        parser = self._parsers[command]
+        try:
+            namespace, _ = parser.parse_known_args(args)
+            return namespace
+        except ShellArgumentError as e:
+            self._print_error(f"Error: {str(e)}")
+            self.console.print(f"Usage: {parser.usage}")
+            return None
+    
     def cmd_help(self, args: List[str]) -> bool:
         """
         Display help information.
@@ -152,38 +561,44 @@ class InteractiveShell:
         Returns:
             bool: True to continue running
         """
-        if args and args[0] in self.commands:
+        doc = self._command_docs.get(args[0]) if args else None
+        if doc is not None:
             # Display help for specific command
-            command = args[0]
-            self.console.print(f"[bold]Help for command: {command}[/bold]")
-            # Get the docstring from the command function
-            doc = self.commands[command].__doc__ or "No help available"
+            self.console.print(f"[bold]Help for command: {args[0]}[/bold]")
             self.console.print(doc)
         else:
             # Display general help
-            self.console.print("[bold blue]Available Commands:[/bold blue]")
-            
-            table = Table(show_header=True, header_style="bold magenta")
-            table.add_column("Command")
-            table.add_column("Description")
-            
-            table.add_row("create", "Create AWS resources")
-            table.add_row("list", "List AWS resources")
-            table.add_row("delete", "Delete AWS resources")
-            table.add_row("update", "Update AWS resources")
-            table.add_row("export", "Export resources as Infrastructure as Code")
-            table.add_row("templates", "List available templates")
-            table.add_row("batch", "Create resources from a YAML file")
-            table.add_row("compliance", "Check resources for compliance")
-            table.add_row("help", "Display this help message")
-            table.add_row("exit/quit", "Exit the shell")
-            
-            self.console.print(table)
+            self._print_info("Available Commands:")
+            self.console.print(self._help_table)
             
             self.console.print("\n[bold yellow]For help on a specific command, type: help <command>[/bold yellow]")
         
         return True
     
+    def _build_help_table(self) -> Table:
+        """
+        Build the table of available commands shown by 'help'.
+        
+        Returns:
+            Table: The help table
+        """
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Command")
+        table.add_column("Description")
+        
+        table.add_row("create", "Create AWS resources")
+        table.add_row("list", "List AWS resources")
+        table.add_row("delete", "Delete AWS resources")
+        table.add_row("update", "Update AWS resources")
+        table.add_row("export", "Export resources as Infrastructure as Code")
+        table.add_row("templates", "List available templates")
+        table.add_row("batch", "Create resources from a YAML file")
+        table.add_row("compliance", "Check resources for compliance")
+        table.add_row("help", "Display this help message")
+        table.add_row("exit/quit", "Exit the shell")
+        
+        return table
+    
     def cmd_exit(self, args: List[str]) -> bool:
         """
         Exit the shell.
@@ -197,6 +612,7 @@ class InteractiveShell:
         self.console.print("[yellow]Exiting AWS Resource Manager...[/yellow]")
         return False
     
+    @_shell_errors("Error creating resource")
     def cmd_create(self, args: List[str]) -> bool:
         """
         Create AWS resources.
@@ -209,60 +625,39 @@ class InteractiveShell:
         Returns:
             bool: True to continue running
         """
-        if not args:
-            self.console.print("[bold red]Error: Service name required[/bold red]")
-            self.console.print("Usage: create <service> [--name <resource_name>] [--template <template>] [--guided] [--dry-run]")
+        # Parse arguments
+        parsed = self._parse_args("create", args)
+        if parsed is None:
             return True
         
-        # Parse arguments
-        service = args[0]
-        resource_name = None
-        template = None
-        guided = False
-        dry_run = False
-        
-        i = 1
-        while i < len(args):
-            if args[i] == "--name" and i + 1 < len(args):
-                resource_name = args[i + 1]
-                i += 2
-            elif args[i] == "--template" and i + 1 < len(args):
-                template = args[i + 1]
-                i += 2
-            elif args[i] == "--guided":
-                guided = True
-                i += 1
-            elif args[i] == "--dry-run":
-                dry_run = True
-                i += 1
-            else:
-                i += 1
+        service = parsed.service
+        resource_name = parsed.name
+        template = parsed.template
+        guided = parsed.guided
+        dry_run = parsed.dry_run
         
         # Execute the create operation
-        self.console.print(f"[bold blue]Creating {service} resource...[/bold blue]")
+        self._print_info(f"Creating {service} resource...")
+        
+        result = self.engine.create_resource(
+            service=service,
+            resource_name=resource_name,
+            template_name=template,
+            guided=guided,
+            dry_run=dry_run,
+            skip_dependency_check=False
+        )
         
-        try:
-            result = self.engine.create_resource(
-                service=service,
-                resource_name=resource_name,
-                template_name=template,
-                guided=guided,
-                dry_run=dry_run,
-                skip_dependency_check=False
-            )
-            
-            if result.success:
-                self.console.print(f"[bold green]Successfully created {service} resource:[/bold green]")
-                self.console.print(result.output)
-            else:
-                self.console.print(f"[bold red]Failed to create {service} resource:[/bold red]")
-                self.console.print(f"[red]{result.error_message}[/red]")
-        except Exception as e:
-            logger.exception("Error creating resource")
-            self.console.print(f"[bold red]Error creating resource: {str(e)}[/bold red]")
+        if result.success:
+            self._print_success(f"Successfully created {service} resource:")
+            self._plain_console.print(result.output)
+        else:
+            self._print_error(f"Failed to create {service} resource:")
+            self.console.print(f"[red]{result.error_message}[/red]")
         
         return True
     
+    @_shell_errors("Error listing resources")
     def cmd_list(self, args: List[str]) -> bool:
         """
         List AWS resources.
@@ -275,49 +670,34 @@ class InteractiveShell:
         Returns:
             bool: True to continue running
         """
-        if not args:
-            self.console.print("[bold red]Error: Service name required[/bold red]")
-            self.console.print("Usage: list <service> [--output <format>] [--filter <filter_expr>]")
+        # Parse arguments
+        parsed = self._parse_args("list", args)
+        if parsed is None:
             return True
         
-        # Parse arguments
-        service = args[0]
-        output_format = "rich"
-        filter_expr = None
-        
-        i = 1
-        while i < len(args):
-            if args[i] == "--output" and i + 1 < len(args):
-                output_format = args[i + 1]
-                i += 2
-            elif args[i] == "--filter" and i + 1 < len(args):
-                filter_expr = args[i + 1]
-                i += 2
-            else:
-                i += 1
+        service = parsed.service
+        output_format = parsed.output
+        filter_expr = parsed.filter
         
         # Execute the list operation
-        self.console.print(f"[bold blue]Listing {service} resources...[/bold blue]")
+        self._print_info(f"Listing {service} resources...")
         
-        try:
-            result = self.engine.list_resources(
-                service=service,
-                output_format=output_format,
-                filter_expr=filter_expr
-            )
-            
-            if result.success:
-                self.console.print(f"[bold green]{service.upper()} Resources:[/bold green]")
-                self.console.print(result.output)
-            else:
-                self.console.print(f"[bold red]Failed to list {service} resources:[/bold red]")
-                self.console.print(f"[red]{result.error_message}[/red]")
-        except Exception as e:
-            logger.exception("Error listing resources")
-            self.console.print(f"[bold red]Error listing resources: {str(e)}[/bold red]")
+        result = self.engine.list_resources(
+            service=service,
+            output_format=output_format,
+            filter_expr=filter_expr
+        )
+        
+        if result.success:
+            self._print_success(f"{service.upper()} Resources:")
+            self._plain_console.print(result.output)
+        else:
+            self._print_error(f"Failed to list {service} resources:")
+            self.console.print(f"[red]{result.error_message}[/red]")
         
         return True
     
+    @_shell_errors("Error deleting resource")
     def cmd_delete(self, args: List[str]) -> bool:
         """
         Delete AWS resources.
@@ -330,59 +710,43 @@ class InteractiveShell:
         Returns:
             bool: True to continue running
         """
-        if len(args) < 2:
-            self.console.print("[bold red]Error: Service name and resource ID required[/bold red]")
-            self.console.print("Usage: delete <service> <resource_id> [--force] [--dry-run]")
+        # Parse arguments
+        parsed = self._parse_args("delete", args)
+        if parsed is None:
             return True
         
-        # Parse arguments
-        service = args[0]
-        resource_id = args[1]
-        force = False
-        dry_run = False
-        
-        i = 2
-        while i < len(args):
-            if args[i] == "--force":
-                force = True
-                i += 1
-            elif args[i] == "--dry-run":
-                dry_run = True
-                i += 1
-            else:
-                i += 1
+        service = parsed.service
+        resource_id = parsed.resource_id
+        force = parsed.force
+        dry_run = parsed.dry_run
         
         # Ask for confirmation if not forced
         if not force:
-            from prompt_toolkit.shortcuts import confirm
             confirmed = confirm(f"Are you sure you want to delete the {service} resource with ID {resource_id}?")
             if not confirmed:
                 self.console.print("[yellow]Operation cancelled by user[/yellow]")
                 return True
         
         # Execute the delete operation
-        self.console.print(f"[bold blue]Deleting {service} resource...[/bold blue]")
+        self._print_info(f"Deleting {service} resource...")
         
-        try:
-            result = self.engine.delete_resource(
-                service=service,
-                resource_id=resource_id,
-                dry_run=dry_run,
-                skip_dependency_check=False
-            )
-            
-            if result.success:
-                self.console.print(f"[bold green]Successfully deleted {service} resource:[/bold green]")
-                self.console.print(result.output)
-            else:
-                self.console.print(f"[bold red]Failed to delete {service} resource:[/bold red]")
-                self.console.print(f"[red]{result.error_message}[/red]")
-        except Exception as e:
-            logger.exception("Error deleting resource")
-            self.console.print(f"[bold red]Error deleting resource: {str(e)}[/bold red]")
+        result = self.engine.delete_resource(
+            service=service,
+            resource_id=resource_id,
+            dry_run=dry_run,
+            skip_dependency_check=False
+        )
+        
+        if result.success:
+            self._print_success(f"Successfully deleted {service} resource:")
+            self._plain_console.print(result.output)
+        else:
+            self._print_error(f"Failed to delete {service} resource:")
+            self.console.print(f"[red]{result.error_message}[/red]")
         
         return True
     
+    @_shell_errors("Error updating resource")
     def cmd_update(self, args: List[str]) -> bool:
         """
         Update AWS resources.
@@ -395,59 +759,40 @@ class InteractiveShell:
         Returns:
             bool: True to continue running
         """
-        if len(args) < 2:
-            self.console.print("[bold red]Error: Service name and resource ID required[/bold red]")
-            self.console.print("Usage: update <service> <resource_id> [--param key=value]... [--guided] [--dry-run]")
+        # Parse arguments
+        parsed = self._parse_args("update", args)
+        if parsed is None:
             return True
         
-        # Parse arguments
-        service = args[0]
-        resource_id = args[1]
-        params = {}
-        guided = False
-        dry_run = False
-        
-        i = 2
-        while i < len(args):
-            if args[i] == "--param" and i + 1 < len(args):
-                param = args[i + 1]
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    params[key] = value
-                i += 2
-            elif args[i] == "--guided":
-                guided = True
-                i += 1
-            elif args[i] == "--dry-run":
-                dry_run = True
-                i += 1
-            else:
-                i += 1
+        service = parsed.service
+        resource_id = parsed.resource_id
+        guided = parsed.guided
+        dry_run = parsed.dry_run
+        
+        # key=value pairs; entries without '=' are ignored
+        params = dict(param.split('=', 1) for param in parsed.param if '=' in param)
         
         # Execute the update operation
-        self.console.print(f"[bold blue]Updating {service} resource...[/bold blue]")
+        self._print_info(f"Updating {service} resource...")
+        
+        result = self.engine.update_resource(
+            service=service,
+            resource_id=resource_id,
+            parameters=params,
+            guided=guided,
+            dry_run=dry_run
+        )
         
-        try:
-            result = self.engine.update_resource(
-                service=service,
-                resource_id=resource_id,
-                parameters=params,
-                guided=guided,
-                dry_run=dry_run
-            )
-            
-            if result.success:
-                self.console.print(f"[bold green]Successfully updated {service} resource:[/bold green]")
-                self.console.print(result.output)
-            else:
-                self.console.print(f"[bold red]Failed to update {service} resource:[/bold red]")
-                self.console.print(f"[red]{result.error_message}[/red]")
-        except Exception as e:
-            logger.exception("Error updating resource")
-            self.console.print(f"[bold red]Error updating resource: {str(e)}[/bold red]")
+        if result.success:
+            self._print_success(f"Successfully updated {service} resource:")
+            self._plain_console.print(result.output)
+        else:
+            self._print_error(f"Failed to update {service} resource:")
+            self.console.print(f"[red]{result.error_message}[/red]")
         
         return True
     
+    @_shell_errors("Error exporting resources")
     def cmd_export(self, args: List[str]) -> bool:
         """
         Export AWS resources as Infrastructure as Code.
@@ -461,51 +806,35 @@ class InteractiveShell:
             bool: True to continue running
         """
         # Parse arguments
-        export_format = "terraform"
-        output_path = "."
-        resource_ids = []
-        region = None
-        
-        i = 0
-        while i < len(args):
-            if args[i] == "--format" and i + 1 < len(args):
-                export_format = args[i + 1]
-                i += 2
-            elif args[i] == "--output" and i + 1 < len(args):
-                output_path = args[i + 1]
-                i += 2
-            elif args[i] == "--resource" and i + 1 < len(args):
-                resource_ids.append(args[i + 1])
-                i += 2
-            elif args[i] == "--region" and i + 1 < len(args):
-                region = args[i + 1]
-                i += 2
-            else:
-                i += 1
+        parsed = self._parse_args("export", args)
+        if parsed is None:
+            return True
+        
+        export_format = parsed.format
+        output_path = parsed.output
+        resource_ids = parsed.resource
+        region = parsed.region
         
         # Execute the export operation
-        self.console.print(f"[bold blue]Exporting resources as {export_format}...[/bold blue]")
+        self._print_info(f"Exporting resources as {export_format}...")
         
-        try:
-            result = self.engine.export_resources(
-                export_format=export_format,
-                output_path=output_path,
-                resource_ids=resource_ids,
-                region=region
-            )
-            
-            if result.success:
-                self.console.print(f"[bold green]Successfully exported resources:[/bold green]")
-                self.console.print(f"Output: {result.output}")
-            else:
-                self.console.print(f"[bold red]Failed to export resources:[/bold red]")
-                self.console.print(f"[red]{result.error_message}[/red]")
-        except Exception as e:
-            logger.exception("Error exporting resources")
-            self.console.print(f"[bold red]Error exporting resources: {str(e)}[/bold red]")
+        result = self.engine.export_resources(
+            export_format=export_format,
+            output_path=output_path,
+            resource_ids=resource_ids,
+            region=region
+        )
+        
+        if result.success:
+            self._print_success("Successfully exported resources:")
+            self.console.print(f"Output: {result.output}")
+        else:
+            self._print_error("Failed to export resources:")
+            self.console.print(f"[red]{result.error_message}[/red]")
         
         return True
     
+    @_shell_errors("Error listing templates")
     def cmd_list_templates(self, args: List[str]) -> bool:
         """
         List available templates for resource creation.
@@ -519,36 +848,37 @@ class InteractiveShell:
             bool: True to continue running
         """
         # Parse arguments
-        service = None
+        parsed = self._parse_args("templates", args)
+        if parsed is None:
+            return True
         
-        i = 0
-        while i < len(args):
-            if args[i] == "--service" and i + 1 < len(args):
-                service = args[i + 1]
-                i += 2
-            else:
-                i += 1
+        service = parsed.service
         
         # Execute the list templates operation
-        self.console.print("[bold blue]Loading templates...[/bold blue]")
+        self._print_info("Loading templates...")
         
-        try:
-            templates = self.engine.get_templates(service)
+        templates = self.engine.get_templates(service)
+        
+        if templates:
+            self._print_success("Available Templates:")
             
-            if templates:
-                self.console.print("[bold green]Available Templates:[/bold green]")
-                for category, template_list in templates.items():
-                    self.console.print(f"\n[bold cyan]{category.upper()}[/bold cyan]")
-                    for template in template_list:
-                        self.console.print(f"  [yellow]{template['name']}[/yellow]: {template['description']}")
-            else:
-                self.console.print("[yellow]No templates found[/yellow]")
-        except Exception as e:
-            logger.exception("Error listing templates")
-            self.console.print(f"[bold red]Error listing templates: {str(e)}[/bold red]")
+            # Render the whole listing in one print
+            lines = []
+            for category, template_list in templates.items():
+                lines.append(Text(f"\n{category.upper()}", style=_CATEGORY_STYLE))
+                for template in template_list:
+                    lines.append(Text.assemble(
+                        ("  ", ""),
+                        (template['name'], _TEMPLATE_NAME_STYLE),
+                        f": {template['description']}"
+                    ))
+            self.console.print(Group(*lines))
+        else:
+            self.console.print("[yellow]No templates found[/yellow]")
         
         return True
     
+    @_shell_errors("Error in batch creation")
     def cmd_batch_create(self, args: List[str]) -> bool:
         """
         Create multiple AWS resources from a YAML file.
@@ -561,49 +891,34 @@ class InteractiveShell:
         Returns:
             bool: True to continue running
         """
-        if not args:
-            self.console.print("[bold red]Error: YAML file path required[/bold red]")
-            self.console.print("Usage: batch <file> [--dry-run] [--ignore-errors]")
+        # Parse arguments
+        parsed = self._parse_args("batch", args)
+        if parsed is None:
             return True
         
-        # Parse arguments
-        file_path = args[0]
-        dry_run = False
-        ignore_errors = False
-        
-        i = 1
-        while i < len(args):
-            if args[i] == "--dry-run":
-                dry_run = True
-                i += 1
-            elif args[i] == "--ignore-errors":
-                ignore_errors = True
-                i += 1
-            else:
-                i += 1
+        file_path = parsed.file
+        dry_run = parsed.dry_run
+        ignore_errors = parsed.ignore_errors
         
         # Execute the batch create operation
-        self.console.print(f"[bold blue]Creating resources from {file_path}...[/bold blue]")
+        self._print_info(f"Creating resources from {file_path}...")
         
-        try:
-            result = self.engine.batch_create_resources(
-                file_path=file_path,
-                dry_run=dry_run,
-                ignore_errors=ignore_errors
-            )
-            
-            if result.success:
-                self.console.print(f"[bold green]Successfully created resources:[/bold green]")
-                self.console.print(result.output)
-            else:
-                self.console.print(f"[bold red]Failed to create resources:[/bold red]")
-                self.console.print(f"[red]{result.error_message}[/red]")
-        except Exception as e:
-            logger.exception("Error in batch creation")
-            self.console.print(f"[bold red]Error in batch creation: {str(e)}[/bold red]")
+        result = self.engine.batch_create_resources(
+            file_path=file_path,
+            dry_run=dry_run,
+            ignore_errors=ignore_errors
+        )
+        
+        if result.success:
+            self._print_success("Successfully created resources:")
+            self._plain_console.print(result.output)
+        else:
+            self._print_error("Failed to create resources:")
+            self.console.print(f"[red]{result.error_message}[/red]")
         
         return True
     
+    @_shell_errors("Error checking compliance")
     def cmd_check_compliance(self, args: List[str]) -> bool:
         """
         Check AWS resources for compliance with security standards.
@@ -616,42 +931,18 @@ class InteractiveShell:
         Returns:
             bool: True to continue running
         """
-        if not args:
-            self.console.print("[bold red]Error: Service name required[/bold red]")
-            self.console.print("Usage: compliance <service> [--type <resource_type>] [--id <resource_id>] [--standard <standard>] [--output <format>] [--report <file>] [--severity <level>]")
+        # Parse arguments
+        parsed = self._parse_args("compliance", args)
+        if parsed is None:
             return True
         
-        # Parse arguments
-        service = args[0]
-        resource_type = None
-        resource_id = None
-        standard = "pci-dss"
-        output_format = "rich"
-        report_file = None
-        severity_threshold = "warning"
-        
-        i = 1
-        while i < len(args):
-            if args[i] == "--type" and i + 1 < len(args):
-                resource_type = args[i + 1]
-                i += 2
-            elif args[i] == "--id" and i + 1 < len(args):
-                resource_id = args[i + 1]
-                i += 2
-            elif args[i] == "--standard" and i + 1 < len(args):
-                standard = args[i + 1]
-                i += 2
-            elif args[i] == "--output" and i + 1 < len(args):
-                output_format = args[i + 1]
-                i += 2
-            elif args[i] == "--report" and i + 1 < len(args):
-                report_file = args[i + 1]
-                i += 2
-            elif args[i] == "--severity" and i + 1 < len(args):
-                severity_threshold = args[i + 1]
-                i += 2
-            else:
-                i += 1
+        service = parsed.service
+        resource_type = parsed.type
+        resource_id = parsed.id
+        standard = parsed.standard
+        output_format = parsed.output
+        report_file = parsed.report
+        severity_threshold = parsed.severity
         
         # Prepare parameters for the operation
         params = {
@@ -662,36 +953,32 @@ class InteractiveShell:
         }
         
         # Execute the check_compliance operation
-        self.console.print(f"[bold blue]Checking {service} compliance against {standard}...[/bold blue]")
+        self._print_info(f"Checking {service} compliance against {standard}...")
         
-        try:
-            result = self.engine.execute_operation(
-                service=service,
-                operation="check_compliance",
-                **params
-            )
+        result = self.engine.execute_operation(
+            service=service,
+            operation="check_compliance",
+            **params
+        )
+        
+        if result.success:
+            # Display results based on output format
+            if output_format == "rich":
+                self._display_compliance_results(result.output, service, standard)
+            elif output_format == "json":
+                # Serialize straight to the console's stream rather than through markup rendering
+                json.dump(result.output, self.console.file, indent=2, ensure_ascii=False)
+                self.console.file.write("\n")
+            elif output_format == "yaml":
+                _dump_yaml(result.output, self.console.file)
             
-            if result.success:
-                # Display results based on output format
-                if output_format == "rich":
-                    self._display_compliance_results(result.output, service, standard)
-                elif output_format == "json":
-                    import json
-                    self.console.print(json.dumps(result.output, indent=2))
-                elif output_format == "yaml":
-                    import yaml
-                    self.console.print(yaml.dump(result.output))
-                
-                # Save report if requested
-                if report_file:
-                    self._save_compliance_report(result.output, report_file, output_format)
-                    self.console.print(f"[green]Compliance report saved to {report_file}[/green]")
-            else:
-                self.console.print(f"[bold red]Failed to check {service} compliance:[/bold red]")
-                self.console.print(f"[red]{result.error_message}[/red]")
-        except Exception as e:
-            logger.exception("Error checking compliance")
-            self.console.print(f"[bold red]Error checking compliance: {str(e)}[/bold red]")
+            # Save report if requested
+            if report_file:
+                self._save_compliance_report(result.output, report_file, output_format)
+                self.console.print(f"[green]Compliance report saved to {report_file}[/green]")
+        else:
+            self._print_error(f"Failed to check {service} compliance:")
+            self.console.print(f"[red]{result.error_message}[/red]")
         
         return True
     
@@ -704,52 +991,17 @@ class InteractiveShell:
             service: The service that was checked
             standard: The compliance standard used
         """
-        from rich.table import Table
+        tree = Tree(f"[bold blue]Compliance Report: {service.upper()} against {standard.upper()}[/bold blue]")
         
-        self.console.print(f"[bold blue]Compliance Report: {service.upper()} against {standard.upper()}[/bold blue]")
-        
-        # Generic display for any service
         if isinstance(results, dict):
             for category, items in results.items():
-                self.console.print(f"\n[bold]{category.replace('_', ' ').title()}:[/bold]")
-                
-                if isinstance(items, dict):
-                    table = Table(show_header=True, header_style="bold")
-                    
-                    # Try to determine columns based on content
-                    if "compliant" in items:
-                        table.add_column("Status")
-                        
-                        if items["compliant"]:
-                            table.add_row("[green]Compliant[/green]")
-                        else:
-                            table.add_row("[red]Non-compliant[/red]")
-                            
-                            # Display issues if present
-                            if "issues" in items and isinstance(items["issues"], list):
-                                for issue in items["issues"]:
-                                    self.console.print(f"  - [red]{issue}[/red]")
-                    else:
-                        # Generic table for unknown structure
-                        table.add_column("Key")
-                        table.add_column("Value")
-                        
-                        for key, value in items.items():
-                            if not isinstance(value, (dict, list)):
-                                table.add_row(key, str(value))
-                    
-                    self.console.print(table)
-                elif isinstance(items, list):
-                    for item in items:
-                        if isinstance(item, str):
-                            self.console.print(f"  - {item}")
-                        else:
-                            self.console.print(f"  - {str(item)}")
-                else:
-                    self.console.print(f"  {str(items)}")
+                branch = tree.add(f"[bold]{category.replace('_', ' ').title()}:[/bold]")
+                _add_tree_nodes(branch, items)
         else:
             # Fallback for non-dict results
-            self.console.print(str(results))
+            tree.add(str(results))
+        
+        self.console.print(tree)
     
     def _save_compliance_report(self, results: Dict[str, Any], filename: str, format: str) -> None:
         """
@@ -760,15 +1012,15 @@ class InteractiveShell:
             filename: The file to save to
             format: The output format
         """
-        with open(filename, 'w') as f:
+        # A large buffer coalesces the serializers' many small writes
+        with open(filename, 'w', encoding="utf-8", buffering=_REPORT_BUFFER_SIZE) as f:
             if format == "json":
-                import json
-                json.dump(results, f, indent=2)
+                json.dump(results, f, indent=2, ensure_ascii=False)
             elif format == "yaml":
-                import yaml
-                yaml.dump(results, f)
+                _dump_yaml(results, f)
             else:
-                # Default to pretty text format
-                from rich.console import Console
-                file_console = Console(file=f, width=100)
+                # Default to pretty text format, rendered in memory and written once
+                buffer = io.StringIO()
+                file_console = Console(file=buffer, width=100)
                 file_console.print(results)
+                f.write(buffer.getvalue())
@@ -9,16 +9,238 @@ for different AWS services.
 """
 
 import os
+import re
+import json
 import sys
 import importlib
 import importlib.util
-import inspect
 import logging
-from typing import Dict, List, Any, Optional, Set
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Dict, List, Any, Optional, Set, Tuple
 
 from core.config_manager import ConfigManager
 from utils.logger import setup_logger
 
+# Install layout, resolved once at import
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_MODULES_DIR = os.path.join(_PACKAGE_ROOT, "modules")
+
+# Plugin files are imported on a thread pool when at least this many are loaded at once
+_PARALLEL_LOAD_THRESHOLD = 3
+_MAX_LOAD_WORKERS = 8
+
+# A plugin file declares the services it provides with "# service: <name>"
+# header lines, so discovery can index it without importing it
+_SERVICE_MARKER = re.compile(rb"^#[ \t]*service:[ \t]*([\w.-]+)[ \t]*\r?$", re.MULTILINE)
+_MARKER_SCAN_BYTES = 512
+
+# Unmarked plugin files must import ServiceModule within this many bytes
+_SERVICE_PROBE_BYTES = 2048
+
+# Plugin file entry: (category, module name, file path)
+PluginFile = Tuple[str, str, str]
+
+# (path, mtime_ns, size) of every plugin file
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+# Discovery results keyed by plugin file fingerprint: the service index and
+# the plugin files without service markers, which have to be loaded eagerly
+_discovery_cache: Dict[Fingerprint, Tuple[Dict[str, PluginFile], List[PluginFile]]] = {}
+
+# The discovery index is also saved here so later processes can start without
+# walking the modules tree; set AWS_RESOURCE_MANAGER_PLUGIN_CACHE_DISABLE=1 to
+# turn this off
+_INDEX_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "aws_resource_manager", "plugins.json")
+
+def _load_index_cache() -> Optional[Tuple[Fingerprint, Dict[str, PluginFile], List[PluginFile]]]:
+    """
+    Load the saved discovery index, which may be stale
+    
+    Returns:
+        Tuple of (fingerprint, service index, plugin files without markers),
+        or None if there is no usable saved index
+    """
+    if os.environ.get("AWS_RESOURCE_MANAGER_PLUGIN_CACHE_DISABLE"):
+        return None
+    
+    try:
+        with open(_INDEX_CACHE_PATH, "r") as f:
+            data = json.load(f)
+        
+        if data["modules_dir"] != _MODULES_DIR:
+            return None
+        
+        fingerprint = tuple((path, mtime_ns, size) for path, mtime_ns, size in data["fingerprint"])
+        index = {service_name: tuple(plugin_file) for service_name, plugin_file in data["index"].items()}
+        unmarked = [tuple(plugin_file) for plugin_file in data["unmarked"]]
+        
+        # Entries are imported as code, so only trust paths inside the modules tree
+        modules_prefix = os.path.join(os.path.realpath(_MODULES_DIR), "")
+        for _, _, module_path in [*index.values(), *unmarked]:
+            if not os.path.realpath(module_path).startswith(modules_prefix):
+                return None
+        
+        return fingerprint, index, unmarked
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _save_index_cache(fingerprint: Fingerprint, index: Dict[str, PluginFile], unmarked: List[PluginFile]) -> None:
+    """
+    Save the discovery index for later processes
+    
+    Args:
+        fingerprint: Fingerprint the index was built from
+        index: Service index
+        unmarked: Plugin files without service markers
+    """
+    if os.environ.get("AWS_RESOURCE_MANAGER_PLUGIN_CACHE_DISABLE"):
+        return
+    
+    # Best effort; a failed write just means walking the tree again next time
+    try:
+        os.makedirs(os.path.dirname(_INDEX_CACHE_PATH), mode=0o700, exist_ok=True)
+        tmp_path = f"{_INDEX_CACHE_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "modules_dir": _MODULES_DIR,
+                "fingerprint": fingerprint,
+                "index": index,
+                "unmarked": unmarked
+            }, f)
+        os.replace(tmp_path, _INDEX_CACHE_PATH)
+    except Exception:
+        pass
+
+# Generated by `python -m core.plugin_manager --freeze`; set
+# AWS_RESOURCE_MANAGER_FROZEN_PLUGINS_DISABLE=1 to ignore it
+_FROZEN_REGISTRY_PATH = os.path.join(_PACKAGE_ROOT, "core", "plugin_registry.py")
+
+def _load_frozen_registry() -> Optional[Dict[str, PluginFile]]:
+    """
+    Load the service index from the frozen plugin registry, if there is one
+    
+    Returns:
+        Service index, or None if there is no usable frozen registry
+    """
+    if os.environ.get("AWS_RESOURCE_MANAGER_FROZEN_PLUGINS_DISABLE"):
+        return None
+    
+    try:
+        from core.plugin_registry import REGISTRY
+    except ImportError:
+        return None
+    
+    return {
+        service_name: (category, module_name, os.path.join(_MODULES_DIR, category, f"{module_name}.py"))
+        for service_name, (category, module_name) in REGISTRY.items()
+    }
+
+def freeze_plugins(registry_path: str = _FROZEN_REGISTRY_PATH) -> Dict[str, Tuple[str, str]]:
+    """
+    Discover and load every service module, then write a frozen registry
+    
+    Later processes read the registry instead of walking the modules tree.
+    It has to be regenerated after service modules are added, removed or
+    renamed; services missing from it are still found by a fallback scan.
+    
+    Args:
+        registry_path: Path of the registry module to write
+        
+    Returns:
+        The frozen registry, mapping service name to (category, module name)
+    """
+    from core.config_manager import ConfigManager
+    
+    # Scan the tree directly; an existing registry or saved index may be stale
+    plugin_manager = PluginManager(ConfigManager())
+    _, index, unmarked = plugin_manager._scan_plugins()
+    plugin_manager._apply_index(index, unmarked)
+    
+    registry = {}
+    for service_module in plugin_manager.get_all_service_modules():
+        # Plugin modules are imported as modules.<category>.<module name>
+        _, category, module_name = type(service_module).__module__.split(".")
+        registry[service_module.get_service_name()] = (category, module_name)
+    
+    lines = [
+        "# Generated by `python -m core.plugin_manager --freeze`; do not edit.",
+        "# Regenerate after adding, removing or renaming service modules.",
+        "",
+        "REGISTRY = {",
+    ]
+    for service_name in sorted(registry):
+        lines.append(f"    {service_name!r}: {registry[service_name]!r},")
+    lines.append("}")
+    
+    tmp_path = f"{registry_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, registry_path)
+    
+    return registry
+
+def _read_service_markers(module_path: str) -> List[str]:
+    """
+    Read the service names declared in a plugin file's header
+    
+    Args:
+        module_path: Path of the plugin file
+        
+    Returns:
+        List of declared service names (empty if the file has no markers)
+    """
+    with open(module_path, "rb") as f:
+        header = f.read(_MARKER_SCAN_BYTES)
+    return [name.decode("ascii") for name in _SERVICE_MARKER.findall(header)]
+
+def _mentions_service_module(module_path: str) -> bool:
+    """
+    Check whether a plugin file could define a ServiceModule subclass
+    
+    A file that never mentions ServiceModule can't subclass it (short of
+    importing it under another name), so it can be skipped without being
+    executed. Only the start of the file is read, where the import belongs;
+    a plugin file with a longer preamble needs a service marker.
+    
+    Args:
+        module_path: Path of the plugin file
+        
+    Returns:
+        True if the file mentions ServiceModule
+    """
+    with open(module_path, "rb") as f:
+        return b"ServiceModule" in f.read(_SERVICE_PROBE_BYTES)
+
+def _cached_import(fqname: str, module_path: str) -> ModuleType:
+    """
+    Import a plugin file, reusing the module if it's already in sys.modules
+    
+    Args:
+        fqname: Fully qualified module name, e.g. 'modules.compute.ec2'
+        module_path: Path of the plugin file
+        
+    Returns:
+        The imported module
+    """
+    module = sys.modules.get(fqname)
+    if module is not None and getattr(module, "__file__", None) == module_path:
+        return module
+    
+    spec = importlib.util.spec_from_file_location(fqname, module_path)
+    module = importlib.util.module_from_spec(spec)
+    
+    # Register before executing, as the import system does, and roll back on failure
+    sys.modules[fqname] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(fqname, None)
+        raise
+    
+    return module
+
 class ServiceModule:
     """
     Base class for all service modules
@@ -96,65 +318,370 @@ class PluginManager:
         self.config_manager = config_manager
         self.service_modules: Dict[str, ServiceModule] = {}
         self.logger = setup_logger(__name__)
+        
+        # Discovered but not yet loaded services
+        self._index: Dict[str, PluginFile] = {}
+        self._load_lock = threading.RLock()
+        self._revalidation: Optional[threading.Thread] = None
+        self._needs_full_scan = False
+        
+        # Category of each loaded service, and memoized get_available_services
+        # and check_plugins results
+        self._service_category: Dict[str, str] = {}
+        self._available_services: Optional[Dict[str, List[Dict[str, str]]]] = None
+        self._plugin_issues: Optional[List[str]] = None
     
     def discover_plugins(self) -> None:
         """
-        Discover and load all available service modules
+        Discover all available service modules
+        
+        Plugin files that declare their services with "# service: <name>"
+        header lines are only indexed here; each is imported the first time
+        one of its services is requested. Files without markers are loaded
+        immediately.
+        
+        A frozen registry (core/plugin_registry.py, generated with
+        `python -m core.plugin_manager --freeze`) is used as the index when
+        present, skipping the walk entirely; the tree is only scanned if a
+        service isn't in the registry. Otherwise the index is persisted to
+        disk. When a saved index exists it is used straight away, and the
+        modules tree is rescanned on a background thread; if any plugin file
+        changed, the index is updated in place.
         """
         self.logger.info("Discovering service modules...")
         
-        # Get the modules directory
-        modules_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "modules"
+        frozen = _load_frozen_registry()
+        if frozen is not None:
+            self._apply_index(frozen, [])
+            self._needs_full_scan = True
+            self.logger.info("Discovered %d service modules (frozen registry)", len(self._index) + len(self.service_modules))
+            return
+        
+        saved = _load_index_cache()
+        if saved is None:
+            fingerprint, index, unmarked = self._scan_plugins()
+            _save_index_cache(fingerprint, index, unmarked)
+            self._apply_index(index, unmarked)
+        else:
+            fingerprint, index, unmarked = saved
+            self._apply_index(index, unmarked)
+            
+            self._revalidation = threading.Thread(
+                target=self._revalidate_index,
+                args=(fingerprint, unmarked),
+                name="plugin-index",
+                daemon=True
+            )
+            self._revalidation.start()
+        
+        self.logger.info("Discovered %d service modules", len(self._index) + len(self.service_modules))
+    
+    def _scan_plugins(self) -> Tuple[Fingerprint, Dict[str, PluginFile], List[PluginFile]]:
+        """
+        Walk the modules tree and index plugin files by their service markers
+        
+        Results are cached per process, keyed by the path, mtime and size of
+        every plugin file.
+        
+        Returns:
+            Tuple of (fingerprint, service index, plugin files without markers)
+        """
+        plugin_files = self._find_plugin_files(_MODULES_DIR)
+        fingerprint = self._fingerprint(plugin_files)
+        
+        cached = _discovery_cache.get(fingerprint)
+        if cached is None:
+            index: Dict[str, PluginFile] = {}
+            unmarked: List[PluginFile] = []
+            for plugin_file in plugin_files:
+                try:
+                    service_names = _read_service_markers(plugin_file[2])
+                except OSError as e:
+                    self.logger.error("Error reading module %s: %s", plugin_file[1], e)
+                    continue
+                
+                if not service_names:
+                    # Helper modules without a marker that never mention
+                    # ServiceModule can't define one, so they aren't imported;
+                    # only the file's head is checked, so say so in case it is a plugin
+                    try:
+                        if not _mentions_service_module(plugin_file[2]):
+                            self.logger.warning(
+                                "Skipping module %s: no '# service: <name>' marker and no ServiceModule "
+                                "import in its first %d bytes; add a marker if it is a service module",
+                                plugin_file[1], _SERVICE_PROBE_BYTES
+                            )
+                            continue
+                    except OSError as e:
+                        self.logger.error("Error reading module %s: %s", plugin_file[1], e)
+                        continue
+                    unmarked.append(plugin_file)
+                for service_name in service_names:
+                    index[service_name] = plugin_file
+            
+            cached = (index, unmarked)
+            _discovery_cache[fingerprint] = cached
+        
+        index, unmarked = cached
+        return fingerprint, index, unmarked
+    
+    def _apply_index(self, index: Dict[str, PluginFile], unmarked: List[PluginFile], replace: bool = False) -> None:
+        """
+        Record discovered services and load the plugin files without markers
+        
+        Args:
+            index: Service index from discovery
+            unmarked: Plugin files without service markers
+            replace: Drop pending services that are no longer in the index
+        """
+        with self._load_lock:
+            if replace:
+                for service_name in [name for name in self._index if name not in index]:
+                    del self._index[service_name]
+            
+            for service_name, plugin_file in index.items():
+                if service_name not in self.service_modules:
+                    self._index[service_name] = plugin_file
+            
+            self._load_plugin_files(unmarked)
+    
+    def _revalidate_index(self, fingerprint: Fingerprint, unmarked: List[PluginFile]) -> None:
+        """
+        Rescan the modules tree and refresh a saved index that has gone stale
+        
+        Args:
+            fingerprint: Fingerprint the saved index was built from
+            unmarked: Unmarked plugin files already loaded from the saved index
+        """
+        try:
+            new_fingerprint, new_index, new_unmarked = self._scan_plugins()
+        except Exception as e:
+            self.logger.error("Error revalidating plugin index: %s", e)
+            return
+        
+        if new_fingerprint == fingerprint:
+            return
+        
+        self.logger.info("Plugin files changed, refreshing the plugin index")
+        _save_index_cache(new_fingerprint, new_index, new_unmarked)
+        self._apply_index(
+            new_index,
+            [plugin_file for plugin_file in new_unmarked if plugin_file not in unmarked],
+            replace=True
         )
+    
+    def _complete_discovery(self) -> None:
+        """
+        Make sure the index covers every plugin file on disk
         
-        # Discover service categories
-        for category in os.listdir(modules_dir):
-            category_dir = os.path.join(modules_dir, category)
+        Waits for a background index revalidation to finish, if one is
+        running, and scans the modules tree once if the index came from a
+        frozen registry. Must not be called while holding the load lock,
+        which both need to apply their results.
+        """
+        revalidation = self._revalidation
+        if revalidation is not None and revalidation is not threading.current_thread():
+            revalidation.join()
+        
+        if self._needs_full_scan:
+            self._needs_full_scan = False
+            _, index, unmarked = self._scan_plugins()
+            self._apply_index(
+                {name: plugin_file for name, plugin_file in index.items() if name not in self._index},
+                unmarked
+            )
+    
+    def _load_plugin_file(self, category: str, module_name: str, module_path: str) -> List[str]:
+        """
+        Import a plugin file and register the service modules it defines
+        
+        Args:
+            category: The service category (modules subdirectory)
+            module_name: The module name
+            module_path: Path of the plugin file
             
-            if not os.path.isdir(category_dir) or category.startswith("_"):
-                continue
+        Returns:
+            Names of the services registered from the file
+        """
+        try:
+            # Load the module
+            module = _cached_import(f"modules.{category}.{module_name}", module_path)
+        except Exception as e:
+            self.logger.error("Error loading module %s: %s", module_name, e)
+            return []
+        
+        return self._register_service_modules(category, module_name, module)
+    
+    def _load_plugin_files(self, plugin_files: List[PluginFile]) -> None:
+        """
+        Import several plugin files and register their service modules
+        
+        Imports are mostly file I/O and compilation, so with enough files
+        they run on a thread pool. Registration happens afterwards on the
+        calling thread, in the given order.
+        
+        Args:
+            plugin_files: Plugin files to load
+        """
+        if len(plugin_files) < _PARALLEL_LOAD_THRESHOLD:
+            loaded = []
+            for plugin_file in plugin_files:
+                loaded.extend(self._load_plugin_file(*plugin_file))
+        else:
+            loaded = self._import_plugin_files(plugin_files)
+        
+        # One summary line rather than one per service
+        if loaded:
+            self.logger.info("Loaded %d service modules: %s", len(loaded), ", ".join(loaded))
+    
+    def _import_plugin_files(self, plugin_files: List[PluginFile]) -> List[str]:
+        """
+        Import plugin files on a thread pool and register their service modules
+        
+        Args:
+            plugin_files: Plugin files to load
             
-            # Discover service modules in this category
-            for filename in os.listdir(category_dir):
-                if not filename.endswith(".py") or filename.startswith("_"):
+        Returns:
+            Names of the services registered from the files
+        """
+        loaded = []
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(plugin_files))) as executor:
+            futures = [
+                executor.submit(_cached_import, f"modules.{category}.{module_name}", module_path)
+                for category, module_name, module_path in plugin_files
+            ]
+            
+            for (category, module_name, _), future in zip(plugin_files, futures):
+                try:
+                    module = future.result()
+                except Exception as e:
+                    self.logger.error("Error loading module %s: %s", module_name, e)
                     continue
                 
-                module_name = filename[:-3]  # Remove .py extension
-                module_path = os.path.join(category_dir, filename)
+                loaded.extend(self._register_service_modules(category, module_name, module))
+        
+        return loaded
+    
+    def _register_service_modules(self, category: str, module_name: str, module: ModuleType) -> List[str]:
+        """
+        Instantiate and register the service module classes defined in a module
+        
+        Args:
+            category: The service category (modules subdirectory)
+            module_name: The module name
+            module: The imported plugin module
+            
+        Returns:
+            Names of the services registered from the module
+        """
+        loaded = []
+        
+        # Local names keep global lookups out of the scan loop
+        service_base = ServiceModule
+        class_type = type
+        
+        try:
+            # Find service module classes in the module; ServiceModule isn't
+            # an ABC, so an MRO check is equivalent to issubclass
+            for name, obj in list(vars(module).items()):
+                if name.startswith("_"):
+                    continue
                 
-                try:
-                    # Load the module
-                    spec = importlib.util.spec_from_file_location(
-                        f"modules.{category}.{module_name}",
-                        module_path
-                    )
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
+                if (isinstance(obj, class_type) and
+                    service_base in obj.__mro__ and
+                    obj is not service_base):
                     
-                    # Find service module classes in the module
-                    for name, obj in inspect.getmembers(module):
-                        if (inspect.isclass(obj) and
-                            issubclass(obj, ServiceModule) and
-                            obj is not ServiceModule):
-                            
-                            # Instantiate the service module
-                            service_module = obj()
-                            service_name = service_module.get_service_name()
-                            
-                            # Register the service module
-                            self.service_modules[service_name] = service_module
-                            self.logger.info(f"Loaded service module: {service_name}")
-                
-                except Exception as e:
-                    self.logger.error(f"Error loading module {module_name}: {str(e)}")
+                    # Instantiate the service module
+                    service_module = obj()
+                    service_name = service_module.get_service_name()
+                    
+                    # Register the service module
+                    self.service_modules[service_name] = service_module
+                    self._service_category[service_name] = category
+                    self._available_services = None
+                    self._plugin_issues = None
+                    self._index.pop(service_name, None)
+                    loaded.append(service_name)
+                    self.logger.debug("Loaded service module: %s", service_name)
+        
+        except Exception as e:
+            self.logger.error("Error loading module %s: %s", module_name, e)
         
-        self.logger.info(f"Discovered {len(self.service_modules)} service modules")
+        return loaded
+    
+    def _load_all(self) -> None:
+        """
+        Load every indexed service module that hasn't been loaded yet
+        """
+        self._complete_discovery()
+        if not self._index:
+            return
+        
+        with self._load_lock:
+            # A file can declare several services; load each file once
+            self._load_plugin_files(list(dict.fromkeys(self._index.values())))
+            
+            # Anything still indexed was declared but not provided
+            for service_name, plugin_file in list(self._index.items()):
+                del self._index[service_name]
+                self.logger.error("Module %s declares service '%s' but doesn't provide it", plugin_file[1], service_name)
+    
+    def _find_plugin_files(self, modules_dir: str) -> List[PluginFile]:
+        """
+        Find candidate service module files
+        
+        Args:
+            modules_dir: The modules directory to search
+            
+        Returns:
+            List of (category, module name, file path) tuples
+        """
+        plugin_files = []
+        
+        # Discover service categories; scandir entries carry their file type,
+        # so no extra stat call is needed per entry
+        with os.scandir(modules_dir) as entries:
+            categories = sorted(
+                (entry for entry in entries
+                 if not entry.name.startswith("_") and entry.is_dir()),
+                key=lambda entry: entry.name
+            )
+        
+        for category in categories:
+            # Discover service modules in this category
+            with os.scandir(category.path) as entries:
+                module_entries = sorted(
+                    (entry for entry in entries
+                     if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file()),
+                    key=lambda entry: entry.name
+                )
+            
+            for entry in module_entries:
+                module_name = entry.name[:-3]  # Remove .py extension
+                plugin_files.append((category.name, module_name, entry.path))
+        
+        return plugin_files
+    
+    def _fingerprint(self, plugin_files: List[PluginFile]) -> Fingerprint:
+        """
+        Build a cache key that changes whenever a plugin file changes
+        
+        Args:
+            plugin_files: Plugin files as returned by _find_plugin_files
+            
+        Returns:
+            Tuple of (path, mtime_ns, size) entries
+        """
+        fingerprint = []
+        for _, _, module_path in plugin_files:
+            stat = os.stat(module_path)
+            fingerprint.append((module_path, stat.st_mtime_ns, stat.st_size))
+        return tuple(fingerprint)
     
     def get_service_module(self, service_name: str) -> Optional[ServiceModule]:
         """
-        Get a service module by name
+        Get a service module by name, loading it on first use
         
         Args:
             service_name: The name of the service
@@ -162,39 +689,84 @@ class PluginManager:
         Returns:
             The service module, or None if not found
         """
-        return self.service_modules.get(service_name)
+        service_module = self.service_modules.get(service_name)
+        if service_module is not None:
+            return service_module
+        
+        # A saved index or frozen registry may be missing services added since it was written
+        if service_name not in self._index:
+            self._complete_discovery()
+        
+        service_module = self._load_indexed_service(service_name)
+        if service_module is None and (self._discovery_pending() or service_name in self._index):
+            # Or its entry may point at a plugin file that has since been
+            # moved, deleted or changed
+            self._complete_discovery()
+            service_module = self._load_indexed_service(service_name)
+        
+        return service_module
+    
+    def _discovery_pending(self) -> bool:
+        """
+        Check whether the index may still be refreshed by _complete_discovery
+        
+        Returns:
+            True if a revalidation is running or a full scan is outstanding
+        """
+        revalidation = self._revalidation
+        return self._needs_full_scan or (revalidation is not None and revalidation.is_alive())
+    
+    def _load_indexed_service(self, service_name: str) -> Optional[ServiceModule]:
+        """
+        Load a service from the plugin file the index points it at
+        
+        Args:
+            service_name: The name of the service
+            
+        Returns:
+            The service module, or None if it couldn't be loaded
+        """
+        with self._load_lock:
+            plugin_file = self._index.pop(service_name, None)
+            if plugin_file is not None:
+                if not os.path.isfile(plugin_file[2]):
+                    self.logger.debug("Plugin file %s for service '%s' no longer exists", plugin_file[2], service_name)
+                else:
+                    self._load_plugin_file(*plugin_file)
+                    if service_name not in self.service_modules:
+                        self.logger.error("Module %s declares service '%s' but doesn't provide it", plugin_file[1], service_name)
+            
+            return self.service_modules.get(service_name)
     
     def get_all_service_modules(self) -> List[ServiceModule]:
         """
-        Get all registered service modules
+        Get all registered service modules, loading any not yet loaded
         
         Returns:
             List of all service modules
         """
+        self._load_all()
         return list(self.service_modules.values())
     
     def get_available_services(self) -> Dict[str, List[Dict[str, str]]]:
         """
         Get available services grouped by category
         
+        The result is cached until another service module is loaded, and
+        must not be modified by callers.
+        
         Returns:
             Dictionary mapping category to list of services
         """
+        self._load_all()
+        if self._available_services is not None:
+            return self._available_services
+        
         services_by_category: Dict[str, List[Dict[str, str]]] = {}
         
         for service_name, module in self.service_modules.items():
-            # Determine the category from the module path
-            module_path = inspect.getmodule(module).__file__
-            relative_path = os.path.relpath(
-                module_path,
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            )
-            
-            parts = relative_path.split(os.sep)
-            if len(parts) >= 2 and parts[0] == "modules":
-                category = parts[1]
-            else:
-                category = "other"
+            # The category was recorded when the module was loaded
+            category = self._service_category.get(service_name, "other")
             
             # Add the service to the category
             if category not in services_by_category:
@@ -205,18 +777,26 @@ class PluginManager:
                 "display_name": module.get_service_display_name()
             })
         
+        self._available_services = services_by_category
         return services_by_category
     
     def check_plugins(self) -> List[str]:
         """
         Check for issues with loaded plugins
         
+        The result is cached until another service module is loaded.
+        
         Returns:
             List of issues found (empty if no issues)
         """
+        self._load_all()
+        if self._plugin_issues is not None:
+            return list(self._plugin_issues)
+        
         issues = []
         
         for service_name, module in self.service_modules.items():
+            module_class = type(module)
             try:
                 # Check if operations list is implemented
                 operations = module.get_operations()
@@ -224,8 +804,12 @@ class PluginManager:
                 # Check if execute_operation is implemented for each operation
                 for operation in operations:
                     try:
-                        # Just check if the method exists and is callable
-                        if not hasattr(module, operation) or not callable(getattr(module, operation)):
+                        # Just check if the method exists and is callable; looking it
+                        # up on the class avoids binding a method per operation
+                        attribute = getattr(module_class, operation, None)
+                        if attribute is None:
+                            attribute = getattr(module, operation, None)
+                        if not callable(attribute):
                             issues.append(f"Service '{service_name}' declares operation '{operation}' but doesn't implement it")
                     except Exception as e:
                         issues.append(f"Error checking operation '{operation}' in service '{service_name}': {str(e)}")
@@ -233,4 +817,20 @@ class PluginManager:
             except Exception as e:
                 issues.append(f"Error checking service module '{service_name}': {str(e)}")
         
-        return issues 
\ No newline at end of file
+        self._plugin_issues = issues
+        return list(issues)
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Manage AWS Resource Manager service plugins")
+    parser.add_argument("--freeze", action="store_true", help="Write a frozen plugin registry for faster startup")
+    args = parser.parse_args()
+    
+    if args.freeze:
+        # Use the importable module, not __main__, so plugins subclass the same ServiceModule
+        from core.plugin_manager import freeze_plugins as _freeze
+        frozen_registry = _freeze()
+        print(f"Froze {len(frozen_registry)} service modules into {_FROZEN_REGISTRY_PATH}")
+    else:
+        parser.print_help()
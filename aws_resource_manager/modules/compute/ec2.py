@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+# service: ec2
 
 """
 EC2 Service Module - Manages EC2 instances
@@ -207,7 +208,8 @@ class EC2ServiceModule(ServiceModule):
     def list_instances(
         self,
         output_format: str = "rich",
-        filter_expr: Optional[str] = None
+        filter_expr: Optional[str] = None,
+        page_size: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         List EC2 instances
@@ -215,6 +217,7 @@ class EC2ServiceModule(ServiceModule):
         Args:
             output_format: Output format (rich, json, yaml)
             filter_expr: Optional filter expression
+            page_size: Optional number of instances to request per API page
             
         Returns:
             Dictionary with operation result
@@ -232,12 +235,14 @@ class EC2ServiceModule(ServiceModule):
                         key, value = f.split("=", 1)
                         filters.append({"Name": key, "Values": [value]})
             
-            # Describe instances
-            response = ec2.describe_instances(Filters=filters)
+            # Describe instances, following every page of results
+            pagination_config = {"PageSize": page_size} if page_size else {}
+            paginator = ec2.get_paginator("describe_instances")
+            pages = paginator.paginate(Filters=filters, PaginationConfig=pagination_config)
             
             # Extract instance information
             instances = []
-            for reservation in response["Reservations"]:
+            for reservation in (r for page in pages for r in page["Reservations"]):
                 for instance in reservation["Instances"]:
                     instance_info = {
                         "InstanceId": instance["InstanceId"],
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+# service: iam
 
 """
 IAM Service Module - Manages AWS IAM resources
@@ -314,7 +315,8 @@ class IAMServiceModule(ServiceModule):
         self,
         resource_type: str,
         output_format: str = "rich",
-        filter_expr: Optional[str] = None
+        filter_expr: Optional[str] = None,
+        page_size: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         List IAM resources of the specified type
@@ -323,6 +325,7 @@ class IAMServiceModule(ServiceModule):
             resource_type: Type of resource (user, role, policy, group)
             output_format: Output format (rich, json, yaml)
             filter_expr: Optional filter expression
+            page_size: Optional number of items to request per API page
             
         Returns:
             Dictionary with operation result
@@ -331,24 +334,28 @@ class IAMServiceModule(ServiceModule):
             session = boto3.session.Session()
             iam = session.client("iam")
             
-            # Process specific resource type
-            if resource_type == "user":
-                response = iam.list_users()
-                resources = response.get("Users", [])
-            elif resource_type == "role":
-                response = iam.list_roles()
-                resources = response.get("Roles", [])
-            elif resource_type == "policy":
-                response = iam.list_policies(Scope="Local")
-                resources = response.get("Policies", [])
-            elif resource_type == "group":
-                response = iam.list_groups()
-                resources = response.get("Groups", [])
-            else:
+            # Map each resource type to its list operation, result key and parameters
+            list_operations = {
+                "user": ("list_users", "Users", {}),
+                "role": ("list_roles", "Roles", {}),
+                "policy": ("list_policies", "Policies", {"Scope": "Local"}),
+                "group": ("list_groups", "Groups", {})
+            }
+            
+            if resource_type not in list_operations:
                 return {
                     "success": False,
                     "error": f"Invalid resource type: {resource_type}. Must be one of: user, role, policy, group"
                 }
+            
+            # Process specific resource type, following every page of results
+            operation, result_key, operation_params = list_operations[resource_type]
+            pagination_config = {"PageSize": page_size} if page_size else {}
+            paginator = iam.get_paginator(operation)
+            
+            resources = []
+            for page in paginator.paginate(PaginationConfig=pagination_config, **operation_params):
+                resources.extend(page.get(result_key, []))
                 
             # Apply filter if specified
             if filter_expr:
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the configuration manager
+"""
+
+import os
+import gc
+import shutil
+import tempfile
+import marshal
+import unittest
+import weakref
+from unittest import mock
+
+# Keep the tests away from the user's YAML sidecar cache
+os.environ.setdefault("AWS_RESOURCE_MANAGER_YAML_CACHE_DISABLE", "1")
+
+import yaml
+
+from core import config_manager as config_manager_module
+from core.config_manager import ConfigManager, _read_yaml_description
+
+
+class TemplateListingTest(unittest.TestCase):
+    def setUp(self):
+        self.templates_dir = tempfile.mkdtemp()
+        self.service_dir = os.path.join(self.templates_dir, "ec2")
+        os.mkdir(self.service_dir)
+        
+        self.config_manager = ConfigManager()
+        self.config_manager.templates_dir = self.templates_dir
+    
+    def tearDown(self):
+        shutil.rmtree(self.templates_dir)
+    
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self.service_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+    
+    def test_in_place_edit_refreshes_listing(self):
+        path = self._write("web.yaml", "description: Old\n")
+        self.assertEqual(self.config_manager.get_available_templates("ec2")["ec2"][0]["description"], "Old")
+        
+        # Rewrite the file without touching the directory's mtime
+        dir_stat = os.stat(self.service_dir)
+        self._write("web.yaml", "description: New and longer\n")
+        file_stat = os.stat(path)
+        os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000))
+        os.utime(self.service_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+        
+        self.assertEqual(
+            self.config_manager.get_available_templates("ec2")["ec2"][0]["description"],
+            "New and longer"
+        )
+    
+    def test_clear_template_cache_refreshes_listing(self):
+        path = self._write("web.yaml", "description: Old\n")
+        self.assertEqual(self.config_manager.get_available_templates("ec2")["ec2"][0]["description"], "Old")
+        
+        # An edit the mtime/size key can't see
+        file_stat = os.stat(path)
+        self._write("web.yaml", "description: New\n")
+        os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+        
+        self.config_manager.clear_template_cache()
+        self.assertEqual(self.config_manager.get_available_templates("ec2")["ec2"][0]["description"], "New")
+    
+    def test_get_template_returns_independent_copies(self):
+        self._write("web.yaml", "description: Web\nparameters: {size: small}\n")
+        template = self.config_manager.get_template("ec2", "web")
+        template["parameters"]["size"] = "large"
+        
+        self.assertEqual(self.config_manager.get_template("ec2", "web")["parameters"]["size"], "small")
+        self.assertIsNone(self.config_manager.get_template("ec2", "missing"))
+    
+    def test_get_template_parses_each_version_once(self):
+        self._write("web.yaml", "description: Web\n")
+        parse = config_manager_module._parse_yaml_cached
+        with mock.patch.object(config_manager_module, "_parse_yaml_cached", wraps=parse) as parse_mock:
+            self.config_manager.get_template("ec2", "web")
+            self.config_manager.get_template("ec2", "web")
+            self.assertEqual(parse_mock.call_count, 1)
+            
+            self._write("web.yaml", "description: Web server\n")
+            self.assertEqual(self.config_manager.get_template("ec2", "web")["description"], "Web server")
+            self.assertEqual(parse_mock.call_count, 2)
+
+
+
+class ConfigFlushTest(unittest.TestCase):
+    def setUp(self):
+        self.config_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.config_dir, "settings.yaml")
+    
+    def tearDown(self):
+        shutil.rmtree(self.config_dir)
+    
+    def test_flush_leaves_no_temporary_files(self):
+        config_manager = ConfigManager(self.config_file)
+        config_manager.set_config("aws", "region", "eu-west-1")
+        self.assertTrue(config_manager.flush())
+        
+        self.assertEqual(os.listdir(self.config_dir), ["settings.yaml"])
+        self.assertEqual(ConfigManager(self.config_file).get_config("aws", "region"), "eu-west-1")
+    
+    def test_flushed_manager_is_released(self):
+        config_manager = ConfigManager(self.config_file)
+        config_manager.set_config("aws", "region", "eu-west-1")
+        config_manager.flush()
+        
+        # Nothing left to write, so the exit hook must not keep it alive
+        ref = weakref.ref(config_manager)
+        del config_manager
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+
+class ReadDescriptionTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".yaml")
+        os.close(fd)
+    
+    def tearDown(self):
+        os.remove(self.path)
+    
+    def _read(self, content: str):
+        with open(self.path, "w") as f:
+            f.write(content)
+        return _read_yaml_description(self.path)
+    
+    def test_plain_and_quoted_strings(self):
+        self.assertEqual(self._read("description: Web tier\nresources: []\n"), "Web tier")
+        self.assertEqual(self._read("description: '123'\n"), "123")
+        self.assertEqual(self._read("description: !!str true\n"), "true")
+        self.assertEqual(self._read("resources: []\n"), "")
+    
+    def test_non_string_scalars_need_full_load(self):
+        for value in ("~", "null", "", "123", "1.5", "true", "2024-01-01"):
+            with self.subTest(value=value):
+                self.assertIsNone(self._read(f"description: {value}\n"))
+    
+    def test_duplicate_keys_return_last_value(self):
+        content = "description: First\nresources: [a, b]\ndescription: Second\n"
+        self.assertEqual(self._read(content), yaml.safe_load(content)["description"])
+        self.assertEqual(self._read(content), "Second")
+    
+    def test_merge_key_needs_full_load(self):
+        self.assertIsNone(self._read("base: &base {description: Shared}\n<<: *base\n"))
+
+
+
+class YamlSidecarCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, "cache")
+        self.path = os.path.join(self.tmp_dir, "template.yaml")
+        
+        patches = [
+            mock.patch.dict(os.environ),
+            mock.patch.object(config_manager_module, "_YAML_CACHE_DIR", self.cache_dir),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        os.environ.pop("AWS_RESOURCE_MANAGER_YAML_CACHE_DISABLE", None)
+        
+        config_manager_module._parse_yaml_cached.cache_clear()
+        self.addCleanup(config_manager_module._parse_yaml_cached.cache_clear)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def _parse(self, content: str):
+        with open(self.path, "w") as f:
+            f.write(content)
+        file_stat = os.stat(self.path)
+        config_manager_module._parse_yaml_cached.cache_clear()
+        return config_manager_module._parse_yaml_cached(self.path, file_stat.st_mtime_ns, file_stat.st_size)
+    
+    def _key(self):
+        file_stat = os.stat(self.path)
+        return (self.path, file_stat.st_mtime_ns, file_stat.st_size)
+    
+    def test_sidecar_holds_plain_data(self):
+        self.assertEqual(self._parse("description: Web\n"), {"description": "Web"})
+        
+        cache_path = config_manager_module._yaml_cache_path(self.path)
+        with open(cache_path, "rb") as f:
+            self.assertEqual(marshal.load(f), (self._key(), {"description": "Web"}))
+        self.assertEqual(os.stat(self.cache_dir).st_mode & 0o777, 0o700)
+    
+    def test_writable_sidecar_is_ignored(self):
+        self._parse("description: Web\n")
+        cache_path = config_manager_module._yaml_cache_path(self.path)
+        with open(cache_path, "wb") as f:
+            marshal.dump((self._key(), {"description": "Tampered"}), f)
+        
+        os.chmod(cache_path, 0o666)
+        config_manager_module._parse_yaml_cached.cache_clear()
+        self.assertEqual(config_manager_module._parse_yaml_cached(*self._key()), {"description": "Web"})
+    
+    def test_clear_template_cache_discards_sidecars(self):
+        self._parse("description: Old\n")
+        
+        # Same size and mtime, so the sidecar's key still matches
+        file_stat = os.stat(self.path)
+        with open(self.path, "w") as f:
+            f.write("description: New\n")
+        os.utime(self.path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+        config_manager_module._parse_yaml_cached.cache_clear()
+        self.assertEqual(config_manager_module._parse_yaml_cached(*self._key()), {"description": "Old"})
+        
+        ConfigManager().clear_template_cache()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        self.assertEqual(config_manager_module._parse_yaml_cached(*self._key()), {"description": "New"})
+    
+    def test_unmarshallable_data_is_not_cached(self):
+        data = self._parse("created: 2024-01-01\n")
+        self.assertEqual(str(data["created"]), "2024-01-01")
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
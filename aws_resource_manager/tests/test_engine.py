@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the resource engine
+"""
+
+import os
+import unittest
+from typing import Any, Dict, List, Optional
+
+from unittest import mock
+
+from core.engine import ResourceEngine, _worker_count
+from core.dependency_resolver import DependencyResolver
+
+
+class LegacyListModule:
+    """
+    Service module whose list method predates the page_size parameter
+    """
+    
+    def get_service_name(self) -> str:
+        return "legacy"
+    
+    def get_operations(self) -> List[str]:
+        return ["list"]
+    
+    def execute_operation(self, operation: str, **kwargs) -> Dict[str, Any]:
+        return getattr(self, f"{operation}_resources")(**kwargs)
+    
+    def list_resources(self, output_format: str = "rich", filter_expr: Optional[str] = None) -> Dict[str, Any]:
+        return {"success": True, "output": [output_format, filter_expr]}
+
+
+class FakePluginManager:
+    def __init__(self, modules: Dict[str, Any]):
+        self.modules = modules
+    
+    def get_service_module(self, service_name: str) -> Optional[Any]:
+        return self.modules.get(service_name)
+    
+    def get_all_service_modules(self) -> List[Any]:
+        return list(self.modules.values())
+
+
+class ListResourcesTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = ResourceEngine(None, FakePluginManager({"legacy": LegacyListModule()}), DependencyResolver())
+    
+    def tearDown(self):
+        self.engine.close()
+    
+    def test_module_without_page_size_kwarg(self):
+        result = self.engine.list_resources("legacy", output_format="json")
+        
+        self.assertTrue(result.success, result.error_message)
+        self.assertEqual(result.output, ["json", None])
+
+
+
+class WorkerCountTest(unittest.TestCase):
+    def _count(self, value: Optional[str]) -> int:
+        with mock.patch.dict(os.environ):
+            os.environ.pop("RESOURCE_ENGINE_WORKERS", None)
+            if value is not None:
+                os.environ["RESOURCE_ENGINE_WORKERS"] = value
+            return _worker_count()
+    
+    def test_default_and_valid_values(self):
+        self.assertEqual(self._count(None), 32)
+        self.assertEqual(self._count("4"), 4)
+    
+    def test_invalid_values_fall_back(self):
+        with self.assertLogs("core.engine", level="WARNING"):
+            self.assertEqual(self._count("many"), 32)
+        with self.assertLogs("core.engine", level="WARNING"):
+            self.assertEqual(self._count(""), 32)
+    
+    def test_values_below_one_are_clamped(self):
+        with self.assertLogs("core.engine", level="WARNING"):
+            self.assertEqual(self._count("0"), 1)
+        with self.assertLogs("core.engine", level="WARNING"):
+            self.assertEqual(self._count("-3"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
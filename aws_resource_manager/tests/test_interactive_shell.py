@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the interactive shell
+"""
+
+import io
+import os
+import shlex
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from rich.console import Console
+
+from core.interactive_shell import InteractiveShell, _BackgroundFileHistory
+
+
+class BackgroundFileHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.history = _BackgroundFileHistory(os.path.join(self.tmp_dir, "history"))
+    
+    def tearDown(self):
+        self.history.flush()
+        shutil.rmtree(self.tmp_dir)
+    
+    def _read(self) -> str:
+        with open(self.history.filename, "r", encoding="utf-8") as f:
+            return f.read()
+    
+    def test_unencodable_entry_does_not_stop_the_writer(self):
+        self.history.store_string("x\ud800")
+        self.history.store_string("list ec2")
+        
+        self.assertTrue(self.history.flush(timeout=5))
+        self.assertIn("+list ec2\n", self._read())
+    
+    def test_writer_survives_unexpected_errors(self):
+        with mock.patch.object(self.history, "_write_batch", side_effect=RuntimeError("boom")):
+            with self.assertLogs("core.interactive_shell", level="ERROR"):
+                self.history.store_string("first")
+                self.assertTrue(self.history.flush(timeout=5))
+        
+        self.history.store_string("second")
+        self.assertTrue(self.history.flush(timeout=5))
+        self.assertIn("+second\n", self._read())
+    
+    def test_flush_gives_up_on_a_stuck_writer(self):
+        release = threading.Event()
+        with mock.patch.object(self.history, "_write_batch", side_effect=lambda batch: release.wait()):
+            self.history.store_string("list ec2")
+            with self.assertLogs("core.interactive_shell", level="WARNING"):
+                self.assertFalse(self.history.flush(timeout=0.1))
+            release.set()
+            self.assertTrue(self.history.flush(timeout=5))
+
+
+
+class ShellTestCase(unittest.TestCase):
+    """
+    Shell without a prompt session, printing to a buffer
+    """
+    
+    engine = None
+    
+    def setUp(self):
+        with mock.patch("core.interactive_shell.PromptSession"):
+            self.shell = InteractiveShell(self.engine)
+        self.output = io.StringIO()
+        self.shell.console = Console(file=self.output, width=200)
+
+
+class ParseArgsTest(ShellTestCase):
+    def test_option_values_may_start_with_a_dash(self):
+        args = self.shell._parse_args("list", ["ec2", "--filter", "-x", "--output", "json"])
+        self.assertEqual((args.service, args.filter, args.output), ("ec2", "-x", "json"))
+        
+        args = self.shell._parse_args("update", ["ec2", "i-1", "--param", "count=-1", "--param", "--guided"])
+        self.assertEqual(args.param, ["count=-1", "--guided"])
+        self.assertFalse(args.guided)
+    
+    def test_trailing_option_and_unknown_arguments_are_ignored(self):
+        args = self.shell._parse_args("list", ["ec2", "--verbose", "--filter"])
+        self.assertEqual((args.service, args.filter), ("ec2", None))
+    
+    def test_missing_argument_prints_usage(self):
+        self.assertIsNone(self.shell._parse_args("delete", ["ec2"]))
+        self.assertIn("Usage: delete <service> <resource_id>", self.output.getvalue())
+
+
+
+class ProcessCommandTest(ShellTestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+        self.shell.commands["list"] = lambda args: self.calls.append(args) or True
+    
+    def test_plain_and_mixed_case_commands(self):
+        self.assertTrue(self.shell.process_command("list"))
+        self.assertTrue(self.shell.process_command("  LIST  "))
+        self.assertEqual(self.calls, [[], []])
+    
+    def test_quoted_arguments_are_unquoted(self):
+        self.shell.process_command("list ec2 --filter 'Name=web server'")
+        self.shell.process_command('list ec2 --filter Name=a\\ b')
+        self.assertEqual(self.calls, [["ec2", "--filter", "Name=web server"], ["ec2", "--filter", "Name=a b"]])
+    
+    def test_unquoted_input_splits_like_shlex(self):
+        for user_input in ("list  ec2\t--output json", "list ec2 --filter Name=web"):
+            with self.subTest(user_input=user_input):
+                self.calls.clear()
+                self.shell.process_command(user_input)
+                self.assertEqual(self.calls, [shlex.split(user_input)[1:]])
+    
+    def test_exit_commands(self):
+        for user_input in ("exit", "quit", ":q", "  exit  ", "EXIT", "quit now"):
+            with self.subTest(user_input=user_input):
+                self.assertFalse(self.shell.process_command(user_input))
+    
+    def test_unknown_command(self):
+        self.assertTrue(self.shell.process_command("lst ec2"))
+        self.assertIn("Unknown command: lst", self.output.getvalue())
+        self.assertEqual(self.calls, [])
+
+
+
+class FailingEngine:
+    """
+    Engine whose operations raise unexpected errors
+    """
+    
+    def list_resources(self, **kwargs):
+        raise RuntimeError("connection reset")
+
+
+class ShellErrorsTest(ShellTestCase):
+    engine = FailingEngine()
+    
+    def test_unexpected_error_is_reported_and_the_shell_continues(self):
+        with self.assertLogs("core.interactive_shell", level="ERROR") as logs:
+            self.assertTrue(self.shell.process_command("list ec2"))
+        
+        self.assertIn("Error listing resources: connection reset", self.output.getvalue())
+        self.assertIn("Traceback", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
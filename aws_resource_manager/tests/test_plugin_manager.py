@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the plugin manager
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import unittest
+from types import ModuleType
+from unittest import mock
+
+from core import plugin_manager as plugin_manager_module
+from core.plugin_manager import PluginManager
+
+PLUGIN_SOURCE = '''# service: widget
+from core.plugin_manager import ServiceModule
+
+
+class WidgetModule(ServiceModule):
+    def __init__(self):
+        super().__init__("widget", "Widget")
+
+    def get_operations(self):
+        return []
+'''
+
+GADGET_SOURCE = PLUGIN_SOURCE.replace("widget", "gadget").replace("Widget", "Gadget")
+
+# Declares a service without defining it
+UNDECLARED_SOURCE = '''# service: gizmo
+from core.plugin_manager import ServiceModule
+'''
+
+
+class PluginTreeTestCase(unittest.TestCase):
+    """
+    Plugin manager over a temporary modules tree, without saved indexes or
+    frozen registries
+    """
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.modules_dir = os.path.join(self.tmp_dir, "modules")
+        
+        patches = [
+            mock.patch.dict(os.environ, {
+                "AWS_RESOURCE_MANAGER_PLUGIN_CACHE_DISABLE": "1",
+                "AWS_RESOURCE_MANAGER_FROZEN_PLUGINS_DISABLE": "1",
+            }),
+            mock.patch.object(plugin_manager_module, "_MODULES_DIR", self.modules_dir),
+            mock.patch.dict(sys.modules),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def _write_plugin(self, category: str, module_name: str, source: str) -> None:
+        os.makedirs(os.path.join(self.modules_dir, category), exist_ok=True)
+        with open(os.path.join(self.modules_dir, category, f"{module_name}.py"), "w") as f:
+            f.write(source)
+
+
+class LazyLoadingTest(PluginTreeTestCase):
+    def test_marked_plugin_is_imported_on_first_use(self):
+        self._write_plugin("alpha", "widget", PLUGIN_SOURCE)
+        plugin_manager = PluginManager(None)
+        plugin_manager.discover_plugins()
+        
+        self.assertNotIn("modules.alpha.widget", sys.modules)
+        self.assertEqual(plugin_manager.service_modules, {})
+        
+        service_module = plugin_manager.get_service_module("widget")
+        self.assertEqual(service_module.get_service_name(), "widget")
+        self.assertIn("modules.alpha.widget", sys.modules)
+    
+    def test_declared_but_missing_service_is_an_error(self):
+        self._write_plugin("alpha", "gizmo", UNDECLARED_SOURCE)
+        plugin_manager = PluginManager(None)
+        plugin_manager.discover_plugins()
+        
+        with self.assertLogs("core.plugin_manager", level="ERROR") as logs:
+            self.assertIsNone(plugin_manager.get_service_module("gizmo"))
+        self.assertIn("declares service 'gizmo'", logs.output[0])
+        
+        # Loading everything reports it the same way
+        plugin_manager = PluginManager(None)
+        plugin_manager.discover_plugins()
+        with self.assertLogs("core.plugin_manager", level="ERROR") as logs:
+            self.assertEqual(plugin_manager.get_all_service_modules(), [])
+        self.assertIn("declares service 'gizmo'", logs.output[0])
+
+
+
+class FrozenRegistryTest(PluginTreeTestCase):
+    def setUp(self):
+        super().setUp()
+        os.environ.pop("AWS_RESOURCE_MANAGER_FROZEN_PLUGINS_DISABLE")
+        
+        # A registry frozen before the gadget plugin was added
+        registry = ModuleType("core.plugin_registry")
+        registry.REGISTRY = {"widget": ("alpha", "widget")}
+        sys.modules["core.plugin_registry"] = registry
+        
+        self._write_plugin("alpha", "widget", PLUGIN_SOURCE)
+        self._write_plugin("beta", "gadget", GADGET_SOURCE)
+    
+    def test_registered_service_is_loaded_without_a_scan(self):
+        plugin_manager = PluginManager(None)
+        with mock.patch.object(plugin_manager, "_scan_plugins") as scan_plugins:
+            plugin_manager.discover_plugins()
+            self.assertIsNotNone(plugin_manager.get_service_module("widget"))
+        scan_plugins.assert_not_called()
+    
+    def test_unregistered_service_is_found_by_a_scan(self):
+        plugin_manager = PluginManager(None)
+        plugin_manager.discover_plugins()
+        
+        service_module = plugin_manager.get_service_module("gadget")
+        self.assertEqual(type(service_module).__module__, "modules.beta.gadget")
+        self.assertEqual(
+            sorted(module.get_service_name() for module in plugin_manager.get_all_service_modules()),
+            ["gadget", "widget"]
+        )
+
+
+class SavedIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.modules_dir = os.path.join(self.tmp_dir, "modules")
+        self.index_path = os.path.join(self.tmp_dir, "plugins.json")
+        for category in ("alpha", "beta"):
+            os.makedirs(os.path.join(self.modules_dir, category))
+        
+        self.plugin_path = os.path.join(self.modules_dir, "alpha", "widget.py")
+        with open(self.plugin_path, "w") as f:
+            f.write(PLUGIN_SOURCE)
+        
+        patches = [
+            mock.patch.dict(os.environ, {"AWS_RESOURCE_MANAGER_FROZEN_PLUGINS_DISABLE": "1"}),
+            mock.patch.object(plugin_manager_module, "_MODULES_DIR", self.modules_dir),
+            mock.patch.object(plugin_manager_module, "_INDEX_CACHE_PATH", self.index_path),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        os.environ.pop("AWS_RESOURCE_MANAGER_PLUGIN_CACHE_DISABLE", None)
+        
+        # Save the index from a first process
+        PluginManager(None).discover_plugins()
+        self.assertTrue(os.path.exists(self.index_path))
+    
+    def tearDown(self):
+        for category in ("alpha", "beta"):
+            sys.modules.pop(f"modules.{category}.widget", None)
+        shutil.rmtree(self.tmp_dir)
+    
+    def _discover_with_slow_revalidation(self) -> PluginManager:
+        plugin_manager = PluginManager(None)
+        revalidate_index = plugin_manager._revalidate_index
+        
+        # Keep the saved index stale when the lookup happens
+        def slow_revalidate_index(*args):
+            time.sleep(0.2)
+            revalidate_index(*args)
+        
+        plugin_manager._revalidate_index = slow_revalidate_index
+        plugin_manager.discover_plugins()
+        return plugin_manager
+    
+    def test_moved_plugin_is_found(self):
+        os.replace(self.plugin_path, os.path.join(self.modules_dir, "beta", "widget.py"))
+        
+        plugin_manager = self._discover_with_slow_revalidation()
+        service_module = plugin_manager.get_service_module("widget")
+        
+        self.assertIsNotNone(service_module)
+        self.assertEqual(type(service_module).__module__, "modules.beta.widget")
+    
+    def test_deleted_plugin_is_not_found(self):
+        os.remove(self.plugin_path)
+        
+        plugin_manager = self._discover_with_slow_revalidation()
+        
+        self.assertIsNone(plugin_manager.get_service_module("widget"))
+        self.assertEqual(plugin_manager.get_all_service_modules(), [])
+    
+    def test_entries_outside_modules_dir_are_rejected(self):
+        with open(self.index_path, "r") as f:
+            data = json.load(f)
+        data["index"]["widget"] = ["alpha", "widget", os.path.join(self.tmp_dir, "widget.py")]
+        with open(self.index_path, "w") as f:
+            json.dump(data, f)
+        
+        self.assertIsNone(plugin_manager_module._load_index_cache())
+        
+        data["index"]["widget"] = ["alpha", "widget", os.path.join(self.modules_dir, "..", "widget.py")]
+        with open(self.index_path, "w") as f:
+            json.dump(data, f)
+        
+        self.assertIsNone(plugin_manager_module._load_index_cache())
+    
+    def test_skipped_unmarked_plugin_is_reported(self):
+        padding = "#" * plugin_manager_module._SERVICE_PROBE_BYTES + "\n"
+        with open(os.path.join(self.modules_dir, "beta", "gadget.py"), "w") as f:
+            f.write(padding + PLUGIN_SOURCE.replace("# service: widget\n", ""))
+        
+        with self.assertLogs("core.plugin_manager", level="WARNING") as logs:
+            _, _, unmarked = PluginManager(None)._scan_plugins()
+        
+        self.assertEqual(unmarked, [])
+        self.assertIn("gadget", logs.output[0])
+
+
+class ServiceProbeTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".py")
+        os.close(fd)
+    
+    def tearDown(self):
+        os.remove(self.path)
+    
+    def _mentions(self, content: str) -> bool:
+        with open(self.path, "w") as f:
+            f.write(content)
+        return plugin_manager_module._mentions_service_module(self.path)
+    
+    def test_only_the_file_header_is_read(self):
+        self.assertTrue(self._mentions("from core.plugin_manager import ServiceModule\n"))
+        self.assertFalse(self._mentions("import os\n"))
+        
+        padding = "#" * plugin_manager_module._SERVICE_PROBE_BYTES + "\n"
+        self.assertFalse(self._mentions(padding + "from core.plugin_manager import ServiceModule\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
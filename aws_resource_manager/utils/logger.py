@@ -11,9 +11,11 @@ including log formatting, file logging, and log rotation.
 import os
 import logging
 import sys
+import functools
 from logging.handlers import RotatingFileHandler
 from typing import Optional
 
+@functools.lru_cache(maxsize=None)
 def setup_logger(
     name: str,
     log_level: int = logging.INFO,
@@ -25,6 +27,9 @@ def setup_logger(
     """
     Set up and configure a logger
     
+    Results are cached, so calling this again with the same arguments returns
+    the already configured logger instead of rebuilding its handlers.
+    
     Args:
         name: Name of the logger
         log_level: Logging level
@@ -119,6 +124,9 @@ def configure_root_logger(
     if root_logger.handlers:
         root_logger.handlers.clear()
     
+    # Force setup_logger to rebuild handlers rather than return a cached logger
+    setup_logger.cache_clear()
+    
     # Set up the logger
     setup_logger(
         name="",  # Root logger has empty name
@@ -1,12 +1,17 @@
 import boto3
 import json
 import re
+import functools
 from typing import Dict, Any, List, Union, Optional
 
+@functools.lru_cache(maxsize=1)
 def validate_aws_credentials() -> bool:
     """
     Validate that AWS credentials are configured properly.
     
+    The result is cached for the life of the process so repeated checks
+    (e.g. from the interactive shell) don't repeat the STS call.
+    
     Returns:
         bool: True if credentials are valid, False otherwise
     """